@@ -115,6 +115,19 @@ def _is_ci_blocking_context() -> bool:
     return os.environ.get("SKILLGATE_CI_MODE", "").strip().lower() in {"1", "true", "yes"}
 
 
+def _remote_cleanup_root(local_path: Path) -> Path | None:
+    """Return the ``skillgate-remote-*`` temp dir that holds a fetched bundle.
+
+    ``fetch_bundle`` returns either that directory or its single top-level
+    entry. Anything else is left alone rather than guessed at, so cleanup can
+    never remove a shared directory such as the system temp dir.
+    """
+    for candidate in (local_path.parent, local_path):
+        if candidate.name.startswith("skillgate-remote-"):
+            return candidate
+    return None
+
+
 def _resolve_bundle_path(path: str, verbose: bool, quiet: bool) -> tuple[Path, Path | None]:
     """Resolve a local path or remote URL to a local directory.
 
@@ -140,13 +153,7 @@ def _resolve_bundle_path(path: str, verbose: bool, quiet: bool) -> tuple[Path, P
             if not quiet:
                 console.print(f"[red]Download error:[/red] {e}")
             raise typer.Exit(code=3) from e
-        # cleanup_path is the temp dir root (parent if we descended into it)
-        cleanup = (
-            local_path
-            if local_path.parent.name.startswith("skillgate-remote-")
-            else local_path.parent
-        )
-        return local_path, cleanup
+        return local_path, _remote_cleanup_root(local_path)
 
     bundle_path = Path(path)
     if not bundle_path.exists():
@@ -600,7 +607,7 @@ def _write_report_output(
     elif output == "sarif":
         formatted = format_sarif(report)
     else:
-        formatted = format_human(report, no_color=no_color)
+        formatted = format_human(report, no_color=no_color, color_system="auto")
 
     if report_file:
         if output == "human":
@@ -694,7 +701,7 @@ def _run_single_scan(
         _write_report_output(result.report, output, report_file, quiet, no_color)
 
         if submit:
-            scan_id = submit_scan_report(report=result.report.model_dump())
+            scan_id = submit_scan_report(report=result.report)
             if not quiet:
                 console.print(f"[green]Submitted scan:[/] {scan_id}")
 
@@ -879,6 +886,9 @@ def _run_fleet_scan(
         total_files = 0
         total_findings = 0
         breakdown: dict[str, int] = {}
+        # Single reference time keeps staleness checks and the report timestamp consistent.
+        now_utc = datetime.now(timezone.utc)
+        passed_keys = frozenset(k for k, v in policy_pass_map.items() if v)
 
         for bundle_path in sorted(bundle_paths, key=lambda p: p.as_posix()):
             key = str(bundle_path.resolve())
@@ -891,9 +901,9 @@ def _run_fleet_scan(
             critical_findings += _count_critical_findings(bundle_result.findings)
             if bundle_result.attestation is None:
                 unsigned_attestations += 1
-            elif _is_stale_attestation(bundle_result.attestation):
+            elif _is_stale_attestation(bundle_result.attestation, now=now_utc):
                 stale_attestations += 1
-            passed = policy_pass_map.get(key, False) and bundle_result.error is None
+            passed = bundle_result.error is None and key in passed_keys
             if passed:
                 passed_bundles += 1
             else:
@@ -915,7 +925,7 @@ def _run_fleet_scan(
         )
 
         report = ScanReport(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=now_utc.isoformat(),
             bundle_name="fleet",
             bundle_root=str(fleet_path.resolve()),
             files_scanned=total_files,
@@ -929,7 +939,7 @@ def _run_fleet_scan(
         _write_report_output(report, output, report_file, quiet, no_color)
 
         if submit:
-            scan_id = submit_scan_report(report=report.model_dump())
+            scan_id = submit_scan_report(report=report)
             if not quiet:
                 console.print(f"[green]Submitted scan:[/] {scan_id}")
 
@@ -947,12 +957,26 @@ def _run_fleet_scan(
                 for _ in range(bundles_scanned):
                     tracker.record_scan()
             else:
-                for _ in range(bundles_scanned):
-                    consume_scan_authoritatively(
-                        mode=enforcement_mode,
-                        api_key=api_key,
-                        entitlement=entitlement,
-                    )
+                # One quota round-trip per bundle; issue them concurrently instead of serially.
+                with ThreadPoolExecutor(max_workers=min(max_workers, bundles_scanned)) as executor:
+                    consumed = [
+                        executor.submit(
+                            consume_scan_authoritatively,
+                            mode=enforcement_mode,
+                            api_key=api_key,
+                            entitlement=entitlement,
+                        )
+                        for _ in range(bundles_scanned)
+                    ]
+                    try:
+                        for future in as_completed(consumed):
+                            future.result()
+                    except BaseException:
+                        # Stop at the first failure (e.g. quota exhausted) like the serial
+                        # loop did: calls not yet started must not consume more quota.
+                        for future in consumed:
+                            future.cancel()
+                        raise
         raise typer.Exit(code=0)
 
     except ParseError as e:
@@ -1008,7 +1032,12 @@ def _count_critical_findings(findings: list[dict[str, object]]) -> int:
     return count
 
 
-def _is_stale_attestation(attestation: dict[str, object], max_age_days: int = 30) -> bool:
+def _is_stale_attestation(
+    attestation: dict[str, object],
+    *,
+    now: datetime,
+    max_age_days: int = 30,
+) -> bool:
     raw_ts = attestation.get("timestamp")
     if not isinstance(raw_ts, str):
         return False
@@ -1017,7 +1046,6 @@ def _is_stale_attestation(attestation: dict[str, object], max_age_days: int = 30
         created = datetime.fromisoformat(normalized)
     except ValueError:
         return False
-    now = datetime.now(timezone.utc)
     return (now - created).days > max_age_days
 
 
@@ -1078,44 +1106,54 @@ def _run_watch_mode(
             reputation_env=reputation_env,
         )
 
-    debounce_timer: threading.Timer | None = None
-    lock = threading.Lock()
+    trigger = threading.Event()
+    stop = threading.Event()
+
+    def _rescan() -> None:
+        if not quiet:
+            console.print("\n[dim]Change detected, re-scanning...[/dim]\n")
+        try:
+            _run_single_scan(
+                path=path,
+                output=output,
+                policy_config=policy_config,
+                enforce=False,
+                report_file=report_file,
+                quiet=quiet,
+                verbose=verbose,
+                sign=sign,
+                key_dir=key_dir,
+                no_color=no_color,
+                explain=explain,
+                explain_backend=explain_backend,
+                explain_mode=explain_mode,
+                reputation_store=reputation_store,
+                reputation_env=reputation_env,
+            )
+        except typer.Exit:
+            pass
+        except Exception as exc:
+            console.print(f"[red]Scan error:[/red] {exc}")
+
+    def _debounce_loop() -> None:
+        # Wait for a first event, then keep waiting until 1s passes with no new events.
+        while not stop.is_set():
+            trigger.wait()
+            trigger.clear()
+            if stop.is_set():
+                return
+            while trigger.wait(1.0):
+                trigger.clear()
+                if stop.is_set():
+                    return
+            _rescan()
 
     class ScanHandler(FileSystemEventHandler):  # type: ignore[misc]
         def on_any_event(self, event: object) -> None:
-            nonlocal debounce_timer
-            with lock:
-                if debounce_timer is not None:
-                    debounce_timer.cancel()
-                debounce_timer = threading.Timer(1.0, self._rescan)
-                debounce_timer.daemon = True
-                debounce_timer.start()
-
-        def _rescan(self) -> None:
-            if not quiet:
-                console.print("\n[dim]Change detected, re-scanning...[/dim]\n")
-            try:
-                _run_single_scan(
-                    path=path,
-                    output=output,
-                    policy_config=policy_config,
-                    enforce=False,
-                    report_file=report_file,
-                    quiet=quiet,
-                    verbose=verbose,
-                    sign=sign,
-                    key_dir=key_dir,
-                    no_color=no_color,
-                    explain=explain,
-                    explain_backend=explain_backend,
-                    explain_mode=explain_mode,
-                    reputation_store=reputation_store,
-                    reputation_env=reputation_env,
-                )
-            except typer.Exit:
-                pass
-            except Exception as exc:
-                console.print(f"[red]Scan error:[/red] {exc}")
+            trigger.set()
+
+    debouncer = threading.Thread(target=_debounce_loop, name="skillgate-watch", daemon=True)
+    debouncer.start()
 
     handler = ScanHandler()
     observer = Observer()
@@ -1130,3 +1168,5 @@ def _run_watch_mode(
             console.print("\n[bold]Watch mode stopped.[/bold]")
         observer.stop()
     observer.join()
+    stop.set()
+    trigger.set()
@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from glob import glob
 from pathlib import Path
 from urllib.parse import quote
@@ -31,6 +33,10 @@ from skillgate.core.scorer.engine import calculate_score
 _ORG_MAX_REPOS = 200
 _ORG_API_PER_PAGE = 100
 _ORG_API_TIMEOUT = 15.0
+# Spawning workers costs ~350 ms (spawn start method, macOS/Windows) before any
+# path is scanned; below this many paths a serial run finishes sooner.
+_SIMULATE_PARALLEL_MIN_PATHS = 16
+_SIMULATE_CHUNKSIZE = 4
 
 
 @dataclass(frozen=True, slots=True)
@@ -106,41 +112,44 @@ def simulate_command(
 
 
 def _simulate_paths(paths: list[str], policy_config: PolicyConfig) -> list[SimulationSample]:
-    samples: list[SimulationSample] = []
-    for path in paths:
-        try:
-            bundle = load_bundle(path)
-            disabled = policy_config.rules.disabled
-            findings = analyze_bundle(bundle, disabled_rules=disabled)
-            findings = filter_disabled_findings(findings, policy_config)
-            findings = apply_rule_overrides(findings, policy_config)
-            score = calculate_score(findings)
-            policy_result = evaluate_policy(findings, score, policy_config)
-            violations = tuple(v.rule for v in policy_result.violations)
-            warnings = tuple(w.rule for w in policy_result.warnings)
-            samples.append(
-                SimulationSample(
-                    path=path,
-                    passed=policy_result.passed,
-                    findings=len(findings),
-                    score=score.total,
-                    violations=violations,
-                    warnings=warnings,
-                )
-            )
-        except ParseError as exc:
-            samples.append(
-                SimulationSample(
-                    path=path,
-                    passed=False,
-                    findings=0,
-                    score=0,
-                    violations=(),
-                    warnings=(),
-                    error=str(exc),
-                )
-            )
-    return samples
+    simulate_one = partial(_simulate_one, policy_config=policy_config)
+    cpu_count = os.cpu_count() or 1
+    if cpu_count < 2 or len(paths) < _SIMULATE_PARALLEL_MIN_PATHS:
+        return [simulate_one(path) for path in paths]
+    # Each path is independent, CPU-bound pure Python work; fan out across cores.
+    max_workers = min(cpu_count, len(paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(simulate_one, paths, chunksize=_SIMULATE_CHUNKSIZE))
+
+
+def _simulate_one(path: str, policy_config: PolicyConfig) -> SimulationSample:
+    try:
+        bundle = load_bundle(path)
+        findings = analyze_bundle(bundle, disabled_rules=policy_config.rules.disabled)
+        findings = filter_disabled_findings(findings, policy_config)
+        findings = apply_rule_overrides(findings, policy_config)
+        score = calculate_score(findings)
+        policy_result = evaluate_policy(findings, score, policy_config)
+        violations = tuple(v.rule for v in policy_result.violations)
+        warnings = tuple(w.rule for w in policy_result.warnings)
+        return SimulationSample(
+            path=path,
+            passed=policy_result.passed,
+            findings=len(findings),
+            score=score.total,
+            violations=violations,
+            warnings=warnings,
+        )
+    except ParseError as exc:
+        return SimulationSample(
+            path=path,
+            passed=False,
+            findings=0,
+            score=0,
+            violations=(),
+            warnings=(),
+            error=str(exc),
+        )
 
 
 def _build_summary(samples: list[SimulationSample]) -> dict[str, object]:
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Callable
+from typing import Literal
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -14,6 +19,13 @@ from skillgate.core.models.enums import Severity
 from skillgate.core.models.finding import Finding
 from skillgate.core.models.report import ScanReport
 
+try:  # Optional linear-time (DFA) regex engine: pip install 'skillgate[speedups]'
+    import re2 as _re_engine
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _re_engine = re
+
+ColorSystem = Literal["auto", "standard", "256", "truecolor"]
+
 # --- Layer 1: Severity colors ---
 
 SEVERITY_COLORS: dict[Severity, str] = {
@@ -30,17 +42,41 @@ SEVERITY_ICONS: dict[Severity, str] = {
     Severity.CRITICAL: "!!!",
 }
 
+# Parsed once so finding table rows can skip the markup parser.
+_SEVERITY_STYLES: dict[Severity, Style] = {
+    sev: Style.parse(color) for sev, color in SEVERITY_COLORS.items()
+}
+_DEFAULT_SEVERITY_STYLE = Style.parse("white")
+_DIM_STYLE = Style(dim=True)
+_CRITICAL_SEVERITY = Severity.CRITICAL.value
+
 # --- Layer 2: Risk score gradient ---
 
-_SCORE_THRESHOLDS: list[tuple[int, str]] = [
+_SCORE_THRESHOLDS: tuple[tuple[int, str], ...] = (
     (25, "green"),
     (75, "yellow"),
     (125, "dark_orange"),
     (200, "bright_red"),
-]
+)
 
 _BAR_WIDTH = 20
 
+# Every possible bar, indexed by the number of filled cells (0.._BAR_WIDTH).
+_BARS: tuple[str, ...] = tuple(
+    "\u2588" * filled + "\u2591" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)
+)
+
+
+def _compute_score_color(score: int) -> str:
+    """Map a risk score (0..200) to a color name by scanning the thresholds."""
+    for threshold, color in _SCORE_THRESHOLDS:
+        if score <= threshold:
+            return color
+    return "bright_red"
+
+
+_SCORE_COLOR_LUT: tuple[str, ...] = tuple(_compute_score_color(s) for s in range(201))
+
 
 def _score_color(score: int) -> str:
     """Map a risk score (0..200) to a color name.
@@ -51,10 +87,7 @@ def _score_color(score: int) -> str:
     Returns:
         Rich color string.
     """
-    for threshold, color in _SCORE_THRESHOLDS:
-        if score <= threshold:
-            return color
-    return "bright_red"
+    return _SCORE_COLOR_LUT[max(0, min(score, 200))]
 
 
 def _score_bar(score: int) -> str:
@@ -68,10 +101,8 @@ def _score_bar(score: int) -> str:
     """
     clamped = max(0, min(score, 200))
     filled = round(clamped / 200 * _BAR_WIDTH)
-    empty = _BAR_WIDTH - filled
-    color = _score_color(clamped)
-    bar = "\u2588" * filled + "\u2591" * empty
-    return f"[{color}]{bar}[/{color}]"
+    color = _SCORE_COLOR_LUT[clamped]
+    return f"[{color}]{_BARS[filled]}[/{color}]"
 
 
 # --- Layer 3: Contextual emphasis (dangerous token highlighting) ---
@@ -90,34 +121,32 @@ _DANGEROUS_TOKENS: list[str] = [
     r"\bcompile\b",
 ]
 
-_DANGEROUS_RE = re.compile("|".join(_DANGEROUS_TOKENS), re.IGNORECASE)
+# Inline (?i) instead of re.IGNORECASE so the pattern compiles under both engines.
+_DANGEROUS_RE: re.Pattern[str] = _re_engine.compile("(?i)" + "|".join(_DANGEROUS_TOKENS))
+_DANGEROUS_STYLE = Style.parse("bold bright_red")
 
 
-def _highlight_dangerous(text: str) -> str:
-    """Wrap dangerous tokens in bold red markup.
-
-    Args:
-        text: Plain text string to scan.
+def _highlight_dangerous_text(text: str) -> Text:
+    """Build a ``Text`` of ``text`` with dangerous tokens in bold red.
 
-    Returns:
-        String with Rich markup around dangerous tokens.
+    Styles are applied to match spans directly rather than through markup,
+    so brackets and backslashes in the text are always shown literally.
     """
-
-    def _repl(m: re.Match[str]) -> str:
-        return f"[bold bright_red]{m.group(0)}[/bold bright_red]"
-
-    return _DANGEROUS_RE.sub(_repl, text)
+    rich_text = Text(text)
+    for match in _DANGEROUS_RE.finditer(text):
+        rich_text.stylize(_DANGEROUS_STYLE, match.start(), match.end())
+    return rich_text
 
 
 # Human-friendly labels for origin types
-_ORIGIN_LABELS: dict[str, str] = {
-    OriginType.CODE.value: "code",
-    OriginType.MARKDOWN_PROSE.value: "markdown prose",
-    OriginType.MARKDOWN_CODEBLOCK.value: "markdown code block",
-    OriginType.DOCUMENT_TEXT.value: "document text",
-    OriginType.CONFIG.value: "config",
-    OriginType.ARCHIVE_MEMBER.value: "archive member",
-    OriginType.UNKNOWN.value: "unknown origin",
+_ORIGIN_LABELS: dict[OriginType, str] = {
+    OriginType.CODE: "code",
+    OriginType.MARKDOWN_PROSE: "markdown prose",
+    OriginType.MARKDOWN_CODEBLOCK: "markdown code block",
+    OriginType.DOCUMENT_TEXT: "document text",
+    OriginType.CONFIG: "config",
+    OriginType.ARCHIVE_MEMBER: "archive member",
+    OriginType.UNKNOWN: "unknown origin",
 }
 
 
@@ -133,7 +162,7 @@ def _format_provenance(finding: Finding) -> str | None:
     prov = finding.provenance
     if prov is None:
         return None
-    label = _ORIGIN_LABELS.get(prov.origin_type.value, prov.origin_type.value)
+    label = _ORIGIN_LABELS.get(prov.origin_type, prov.origin_type.value)
     parts = [label]
     if prov.section:
         parts.append(f"\u00a7 {prov.section}")
@@ -142,11 +171,39 @@ def _format_provenance(finding: Finding) -> str | None:
     return ", ".join(parts)
 
 
+class _LineBuffer:
+    """Accumulate lines and emit them with a single ``Console.print``.
+
+    Each ``Console.print`` call recomputes styles and wrapping, so
+    consecutive text lines are joined and printed together. Call ``flush``
+    before printing any other renderable to preserve output order.
+
+    String lines are parsed as Rich markup one at a time, so text taken from
+    the report must be passed through ``escape`` first. Lines that carry
+    report text with computed styles are written as ``Text`` instead.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self._console = console
+        self._lines: list[Text] = []
+
+    def write(self, line: str | Text = "") -> None:
+        """Queue one line of Rich markup or a prebuilt ``Text``."""
+        self._lines.append(Text.from_markup(line) if isinstance(line, str) else line)
+
+    def flush(self) -> None:
+        """Print all queued lines in one call."""
+        if self._lines:
+            self._console.print(Text("\n").join(self._lines))
+            self._lines.clear()
+
+
 def format_human(
     report: ScanReport,
     console: Console | None = None,
     *,
     no_color: bool = False,
+    color_system: ColorSystem = "truecolor",
 ) -> str:
     """Format a scan report as human-readable Rich output.
 
@@ -154,6 +211,10 @@ def format_human(
         report: The scan report to format.
         console: Optional Rich console for output.
         no_color: Disable colored output (plain text fallback).
+        color_system: Color depth for the internal console. ``"auto"``
+            lets Rich detect it from the environment (``COLORTERM``,
+            ``TERM``); ``"standard"`` (16 colors) emits the shortest ANSI
+            sequences. Ignored when ``console`` is given or ``no_color`` is set.
 
     Returns:
         Formatted string output.
@@ -167,13 +228,16 @@ def format_human(
             width=100,
             no_color=no_color,
             force_terminal=True,
-            color_system=None if no_color else "truecolor",
+            color_system=None if no_color else color_system,
             highlight=False,
         )
     else:
         buf = None
         con = console
 
+    # Span styling would only be computed and discarded without color.
+    highlight: Callable[[str], Text] = Text if no_color else _highlight_dangerous_text
+
     # --- Fleet report ---
     if report.fleet_summary is not None and report.fleet_results is not None:
         summary = report.fleet_summary
@@ -206,9 +270,7 @@ def format_human(
 
         for item in report.fleet_results:
             crit_count = sum(
-                1
-                for finding in item.findings
-                if str(finding.get("severity", "")).lower() == Severity.CRITICAL.value
+                1 for finding in item.findings if finding.get("severity") == _CRITICAL_SEVERITY
             )
             has_policy_failure = bool(
                 isinstance(item.policy, dict) and item.policy.get("passed") is False
@@ -243,39 +305,39 @@ def format_human(
     score_clr = _score_color(score)
     bar = _score_bar(score)
 
-    header_text = (
-        f"[bold]SkillGate v{report.scanner_version}[/bold] \u2014 "
-        f"Skill Security Scan Report\n\n"
-        f"  Bundle: [bold]{report.bundle_name}[/bold]"
-    )
+    bundle_line = f"  Bundle: [bold]{report.bundle_name}[/bold]"
     if report.bundle_version:
-        header_text += f" v{report.bundle_version}"
-    header_text += (
-        f"\n  Files scanned: {report.files_scanned}\n"
+        bundle_line += f" v{report.bundle_version}"
+    parts: list[str] = [
+        f"[bold]SkillGate v{report.scanner_version}[/bold] \u2014 Skill Security Scan Report",
+        "",
+        bundle_line,
+        f"  Files scanned: {report.files_scanned}",
         f"  Risk Score: [{score_clr}]{score}[/{score_clr}] "
         f"[{severity_color}]({report.risk_score.severity.value.upper()})"
-        f"[/{severity_color}]  {bar}\n"
-        f"  Findings: {report.risk_score.findings_count}"
-    )
+        f"[/{severity_color}]  {bar}",
+        f"  Findings: {report.risk_score.findings_count}",
+    ]
 
     # Policy status in header
     if report.policy:
         policy_name = str(report.policy.get("name", "unknown"))
         passed = bool(report.policy.get("passed", True))
         if passed:
-            header_text += f"\n  Policy: {policy_name} \u2014 [green]PASSED[/green]"
+            parts.append(f"  Policy: {policy_name} \u2014 [green]PASSED[/green]")
         else:
             raw_violations = report.policy.get("violations", [])
             viol_list = list(raw_violations) if isinstance(raw_violations, list) else []
-            header_text += (
-                f"\n  Policy: {policy_name} \u2014 [red]FAILED[/red]"
-                f"\n  Violations: {len(viol_list)}"
-            )
+            parts.append(f"  Policy: {policy_name} \u2014 [red]FAILED[/red]")
+            parts.append(f"  Violations: {len(viol_list)}")
 
+    header_text = "\n".join(parts)
     con.print(Panel(header_text, border_style="blue"))
+    out = _LineBuffer(con)
 
     # --- Findings table ---
     if report.findings:
+        findings = [Finding.model_validate(f) for f in report.findings]
         findings_table = Table(
             title="Findings",
             show_header=True,
@@ -289,88 +351,93 @@ def format_human(
         findings_table.add_column("Message", ratio=1)
 
         # Show Origin column only when at least one finding has provenance
-        has_provenance = any(
-            Finding.model_validate(f).provenance is not None for f in report.findings
-        )
+        has_provenance = any(f.provenance is not None for f in findings)
         if has_provenance:
             findings_table.add_column("Origin", width=18)
 
-        for f_dict in report.findings:
-            finding = Finding.model_validate(f_dict)
+        for finding in findings:
             sev = finding.severity
-            color = SEVERITY_COLORS.get(sev, "white")
+            sev_style = _SEVERITY_STYLES.get(sev, _DEFAULT_SEVERITY_STYLE)
             icon = SEVERITY_ICONS.get(sev, "?")
 
             # Layer 3: highlight dangerous tokens in message
-            msg = _highlight_dangerous(finding.message)
+            msg_text = highlight(finding.message)
 
-            row: list[str | Text] = [
-                f"[{color}]{icon}[/{color}]",
-                f"[{color}]{finding.rule_id}[/{color}]",
-                f"[dim]{finding.file}:{finding.line}[/dim]",
-                msg,
+            row: list[Text] = [
+                Text(icon, style=sev_style),
+                Text(finding.rule_id, style=sev_style),
+                Text(f"{finding.file}:{finding.line}", style=_DIM_STYLE),
+                msg_text,
             ]
             if has_provenance:
                 prov_str = _format_provenance(finding)
-                row.append("[dim]{}[/dim]".format(prov_str or "\u2014"))
+                row.append(Text(prov_str or "\u2014", style=_DIM_STYLE))
             findings_table.add_row(*row)
 
         con.print()
         con.print(findings_table)
 
         # Detailed findings with snippets/remediation
-        has_details = any(
-            Finding.model_validate(f).snippet or Finding.model_validate(f).remediation
-            for f in report.findings
-        )
+        has_details = any(f.snippet or f.remediation for f in findings)
         if has_details:
-            con.print("\n[bold]Details:[/bold]\n")
-            for f_dict in report.findings:
-                finding = Finding.model_validate(f_dict)
+            out.write("\n[bold]Details:[/bold]\n")
+            for finding in findings:
                 sev = finding.severity
                 color = SEVERITY_COLORS.get(sev, "white")
                 icon = SEVERITY_ICONS.get(sev, "?")
 
-                con.print(
-                    f"  [{color}]{icon} {finding.rule_id} [{sev.value.upper()}] "
-                    f"{finding.rule_name}[/{color}]"
+                out.write(
+                    f"  [{color}]{icon} {escape(finding.rule_id)} [{sev.value.upper()}] "
+                    f"{escape(finding.rule_name)}[/{color}]"
                 )
                 # Layer 3: dim file path, highlight dangerous tokens in message
-                highlighted_msg = _highlight_dangerous(finding.message)
-                con.print(f"    [dim]{finding.file}:{finding.line}[/dim] \u2014 {highlighted_msg}")
+                out.write(
+                    Text.assemble(
+                        "    ",
+                        (f"{finding.file}:{finding.line}", _DIM_STYLE),
+                        " \u2014 ",
+                        highlight(finding.message),
+                    )
+                )
                 prov_str = _format_provenance(finding)
                 if prov_str:
-                    con.print(f"    [dim]Origin: {prov_str}[/dim]")
+                    out.write(f"    [dim]Origin: {escape(prov_str)}[/dim]")
                 if finding.snippet:
                     # Layer 3: highlight dangerous tokens in snippets
-                    highlighted_snippet = _highlight_dangerous(finding.snippet.rstrip())
-                    con.print(f"    [dim]| {finding.line} |[/dim] {highlighted_snippet}")
+                    out.write(
+                        Text.assemble(
+                            "    ",
+                            (f"| {finding.line} |", _DIM_STYLE),
+                            " ",
+                            highlight(finding.snippet.rstrip()),
+                        )
+                    )
                 if finding.remediation:
-                    con.print(f"    [italic]Remediation: {finding.remediation}[/italic]")
-                con.print()
+                    out.write(f"    [italic]Remediation: {escape(finding.remediation)}[/italic]")
+                out.write()
 
     # Explanations
     if report.explanations:
-        con.print("[bold]Explanations:[/bold]\n")
+        out.write("[bold]Explanations:[/bold]\n")
         for exp_dict in report.explanations:
             rule_id = exp_dict.get("rule_id", "unknown")
             text = exp_dict.get("text", "")
             source = exp_dict.get("source", "unknown")
-            con.print(f"  [bold]{rule_id}[/bold] [dim]({source})[/dim]")
+            out.write(f"  [bold]{escape(rule_id)}[/bold] [dim]({escape(source)})[/dim]")
             for line in text.split("\n"):
-                con.print(f"    {line}")
-            con.print()
+                out.write(f"    {escape(line)}")
+            out.write()
 
     # Policy violations
     if report.policy and not bool(report.policy.get("passed", True)):
         raw_viols = report.policy.get("violations", [])
         viols = list(raw_viols) if isinstance(raw_viols, list) else []
         if viols:
-            con.print("[bold]Policy Violations:[/bold]\n")
+            out.write("[bold]Policy Violations:[/bold]\n")
             for v in viols:
                 reason = v.get("reason", "Unknown violation") if isinstance(v, dict) else str(v)
-                con.print(f"  [red]x[/red] {reason}")
-            con.print()
+                out.write(f"  [red]x[/red] {escape(str(reason))}")
+            out.write()
 
     # Extraction manifest summary
     if report.extraction_manifest:
@@ -382,17 +449,14 @@ def format_human(
             lines.append(f"  Extraction warnings: {warnings_count}")
         if em.provenance_records:
             # Count by origin type
-            origin_counts: dict[str, int] = {}
-            for rec in em.provenance_records:
-                key = rec.origin_type.value if hasattr(rec, "origin_type") else str(rec)
-                origin_counts[key] = origin_counts.get(key, 0) + 1
+            origin_counts = Counter(rec.origin_type for rec in em.provenance_records)
             for origin, count in sorted(origin_counts.items()):
-                label = _ORIGIN_LABELS.get(origin, origin)
+                label = _ORIGIN_LABELS.get(origin, origin.value)
                 lines.append(f"    {label}: {count}")
-        con.print("[bold]Extraction Manifest:[/bold]")
+        out.write("[bold]Extraction Manifest:[/bold]")
         for line in lines:
-            con.print(line)
-        con.print()
+            out.write(line)
+        out.write()
 
     # --- Score breakdown table (with colored scores) ---
     if report.risk_score.breakdown:
@@ -418,22 +482,24 @@ def format_human(
                 f"{pct}%",
             )
 
+        out.flush()
         con.print(breakdown_table)
-        con.print()
+        out.write()
 
     if report.risk_score.findings_count > 0:
-        con.print("[bold]Next steps:[/bold]")
-        con.print(
+        out.write("[bold]Next steps:[/bold]")
+        out.write(
             "  - Run with [bold]--explain[/bold] for finding-level "
             "rationale and remediation context."
         )
-        con.print(
+        out.write(
             "  - Use [bold]--output json --report-file <path>[/bold] "
             "to inspect/share full report details."
         )
-        con.print("  - Rule catalog: [underline]https://docs.skillgate.io/rules[/underline]")
-        con.print("  - Policy reference: [underline]https://docs.skillgate.io/policy[/underline]")
-        con.print()
+        out.write("  - Rule catalog: [underline]https://docs.skillgate.io/rules[/underline]")
+        out.write("  - Policy reference: [underline]https://docs.skillgate.io/policy[/underline]")
+        out.write()
+    out.flush()
 
     if buf is not None:
         return buf.getvalue()
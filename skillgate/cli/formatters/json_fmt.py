@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+import inspect
 import json
+from typing import Final
+
+from pydantic import BaseModel
 
 from skillgate.core.models.report import ScanReport
 
+# ``model_dump_json(fallback=...)`` first shipped in pydantic 2.11.
+_HAS_DUMP_FALLBACK: Final[bool] = (
+    "fallback" in inspect.signature(BaseModel.model_dump_json).parameters
+)
+
 
 def format_json(report: ScanReport) -> str:
     """Format a scan report as JSON.
 
+    On pydantic 2.11+ this serializes directly from the model via
+    pydantic-core, without first building an intermediate ``dict`` tree.
+    That output is UTF-8 (non-ASCII is not ``\\u``-escaped), datetimes in the
+    free-form ``dict[str, object]`` fields are ISO 8601, NaN and infinity
+    are ``null``, and other values pydantic cannot encode are written as
+    ``str(value)``. Older pydantic releases keep the ``json.dumps`` output.
+
     Args:
         report: The scan report to format.
 
     Returns:
-        JSON string with sorted keys and 2-space indentation.
+        JSON string in field declaration order with 2-space indentation.
     """
+    if _HAS_DUMP_FALLBACK:
+        return report.model_dump_json(indent=2, fallback=str)
     return json.dumps(report.model_dump(), indent=2, sort_keys=False, default=str)
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from skillgate.core.analyzer.rules import ALL_RULE_CLASSES
 from skillgate.core.models.enums import Severity
 from skillgate.core.models.report import ScanReport
 
+try:  # Optional fast encoder: pip install 'skillgate[speedups]'
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None  # type: ignore[assignment]
+
 # SARIF schema URI
 SARIF_SCHEMA = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/main/sarif-2.1/schema/sarif-schema-2.1.0.json"
 SARIF_VERSION = "2.1.0"
@@ -22,8 +28,13 @@ _SEVERITY_TO_LEVEL: dict[str, str] = {
 }
 
 
-def _build_rule_descriptors() -> list[dict[str, Any]]:
-    """Build SARIF rule descriptors from all registered rules."""
+@lru_cache(maxsize=1)
+def _build_rule_descriptors() -> tuple[dict[str, Any], ...]:
+    """Build SARIF rule descriptors from all registered rules.
+
+    The rule registry is static for the process lifetime, so descriptors are
+    built once and shared. Callers must not mutate the returned dicts.
+    """
     rules: list[dict[str, Any]] = []
     for rule_cls in ALL_RULE_CLASSES:
         instance = rule_cls()
@@ -41,7 +52,7 @@ def _build_rule_descriptors() -> list[dict[str, Any]]:
             },
         }
         rules.append(descriptor)
-    return rules
+    return tuple(rules)
 
 
 def _finding_to_result(finding: dict[str, object], bundle_root: str) -> dict[str, Any]:
@@ -54,21 +65,26 @@ def _finding_to_result(finding: dict[str, object], bundle_root: str) -> dict[str
     - ``properties.originType``: string label for tooling consumers
     - ``properties.section``: prose section or heading if available
     """
-    rule_id = str(finding.get("rule_id", ""))
-    severity_val = str(finding.get("severity", "medium"))
-    level = _SEVERITY_TO_LEVEL.get(severity_val, "warning")
-
-    message_text = str(finding.get("message", ""))
-    file_path = str(finding.get("file", ""))
-    line_val = finding.get("line", 1)
-    line = int(str(line_val)) if line_val else 1
+    # Findings are dumped from validated Finding models, so fields already
+    # carry their schema types; only fill in defaults for missing values.
+    rule_id = finding.get("rule_id") or ""
+    severity_val = finding.get("severity")
+    level = (
+        _SEVERITY_TO_LEVEL.get(severity_val, "warning")
+        if isinstance(severity_val, str)
+        else "warning"
+    )
+
+    message_text = finding.get("message") or ""
+    file_path = finding.get("file") or ""
+    line = finding.get("line") or 1
     column = finding.get("column")
 
     region: dict[str, Any] = {"startLine": line}
     if column is not None:
-        region["startColumn"] = int(str(column))
+        region["startColumn"] = column
 
-    snippet_text = str(finding.get("snippet", ""))
+    snippet_text = finding.get("snippet")
     if snippet_text:
         region["snippet"] = {"text": snippet_text}
 
@@ -79,20 +95,20 @@ def _finding_to_result(finding: dict[str, object], bundle_root: str) -> dict[str
     }
     provenance = finding.get("provenance")
     if isinstance(provenance, dict):
-        origin_type = str(provenance.get("origin_type", ""))
-        if origin_type:
+        props: dict[str, Any] = {}
+        origin_type = provenance.get("origin_type")
+        if origin_type and isinstance(origin_type, str):
             # Represent origin class as a distinct uriBaseId for SARIF consumers
             artifact_location["uriBaseId"] = f"%{origin_type.upper()}%"
-            artifact_location.setdefault("properties", {})
-            artifact_location["properties"]["originType"] = origin_type
+            props["originType"] = origin_type
         section = provenance.get("section")
         if section:
-            artifact_location.setdefault("properties", {})
-            artifact_location["properties"]["section"] = str(section)
+            props["section"] = section
         page_start = provenance.get("page_start")
         if page_start is not None:
-            artifact_location.setdefault("properties", {})
-            artifact_location["properties"]["pageStart"] = int(str(page_start))
+            props["pageStart"] = page_start
+        if props:
+            artifact_location["properties"] = props
 
     result: dict[str, Any] = {
         "ruleId": rule_id,
@@ -112,7 +128,7 @@ def _finding_to_result(finding: dict[str, object], bundle_root: str) -> dict[str
     if remediation:
         result["fixes"] = [
             {
-                "description": {"text": str(remediation)},
+                "description": {"text": remediation},
             }
         ]
 
@@ -140,7 +156,7 @@ def format_sarif(report: ScanReport) -> str:
                         "name": "SkillGate",
                         "version": report.scanner_version,
                         "informationUri": "https://skillgate.io",
-                        "rules": _build_rule_descriptors(),
+                        "rules": list(_build_rule_descriptors()),
                     }
                 },
                 "results": results,
@@ -170,4 +186,7 @@ def format_sarif(report: ScanReport) -> str:
         ],
     }
 
-    return json.dumps(sarif, indent=2, sort_keys=False)
+    # Both encoders emit non-ASCII as UTF-8, so output does not depend on the extra.
+    if orjson is not None:
+        return orjson.dumps(sarif, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(sarif, indent=2, sort_keys=False, ensure_ascii=False)
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import importlib.util
 import io
 import logging
+import os
+import re
 import shutil
 import tarfile
 import tempfile
 import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Final
-from urllib.parse import quote, urlparse
+from typing import Any, BinaryIO, Final
+from urllib.parse import ParseResult, quote, urlparse
 
 import httpx
 
@@ -21,13 +27,53 @@ _MAX_DOWNLOAD_SIZE = 50 * 1024 * 1024  # 50MB
 _MAX_ARCHIVE_MEMBERS: Final[int] = 10_000
 _MAX_ARCHIVE_TOTAL_UNCOMPRESSED: Final[int] = 200 * 1024 * 1024  # 200MB
 _MAX_ARCHIVE_DEPTH: Final[int] = 20
+# Compression-ratio guards against zip bombs. Ratios are only enforced once the
+# expanded size passes a floor, so small, highly repetitive files stay accepted.
+_MAX_ARCHIVE_COMPRESSION_RATIO: Final[int] = 100
+_MAX_MEMBER_COMPRESSION_RATIO: Final[int] = 1000
+_COMPRESSION_RATIO_FLOOR: Final[int] = 1024 * 1024
+# A gzip stream only reveals compressed sizes cumulatively, so its ratio is
+# checked against a much higher floor; ordinary repetitive files stay below it.
+_STREAM_COMPRESSION_RATIO_FLOOR: Final[int] = 50 * 1024 * 1024
+_STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+_SPOOL_THRESHOLD: Final[int] = 4 * 1024 * 1024
+_TMPFS_ROOT: Final[str] = "/dev/shm"
+# Opt-in: RAM-backed extraction holds untrusted archive contents in memory.
+_TMPFS_ENV: Final[str] = "SKILLGATE_EXTRACT_TMPFS"
+_MAX_PROBE_WORKERS: Final[int] = 8
+_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+_KEEPALIVE_EXPIRY: Final[float] = 60.0
+# HEAD answers that mean the archive is definitely absent; other failures may
+# just be a host that does not support HEAD, so those candidates are still tried.
+_PROBE_MISS_STATUSES: Final[frozenset[int]] = frozenset({404, 410})
+# HTTP/2 needs the optional ``h2`` package (installed with the speedups extra).
+_HTTP2_AVAILABLE: Final[bool] = importlib.util.find_spec("h2") is not None
 _SELECTOR_PREFIXES: Final[tuple[str, ...]] = ("github:", "gitlab:", "forge:")
+# Default branch names to try, already URL-quoted.
+_CANDIDATE_REFS: Final[tuple[str, ...]] = tuple(
+    quote(ref, safe="") for ref in ("main", "master", "HEAD")
+)
+
+_REMOTE_PREFIX_RE: Final[re.Pattern[str]] = re.compile(
+    "|".join(re.escape(prefix) for prefix in ("http://", "https://", *_SELECTOR_PREFIXES)),
+    re.IGNORECASE,
+)
+_ARCHIVE_SUFFIX_RE: Final[re.Pattern[str]] = re.compile(r"\.(?:tar\.gz|tgz|zip)$", re.IGNORECASE)
+# Fast path for the common case: relative, within the depth limit, and free of
+# "..", backslashes and colons. Anything else takes the detailed checks.
+_SAFE_MEMBER_SEGMENT: Final[str] = r"(?!\.\.(?:/|$))[^/\\:]+"
+_SAFE_MEMBER_PATH_RE: Final[re.Pattern[str]] = re.compile(
+    rf"(?:{_SAFE_MEMBER_SEGMENT}/){{0,{_MAX_ARCHIVE_DEPTH - 1}}}{_SAFE_MEMBER_SEGMENT}/?"
+)
+_GZIP_MAGIC: Final[bytes] = b"\x1f\x8b"
+_ZIP_MAGIC: Final[bytes] = b"PK\x03\x04"
+
+_ArchiveData = bytes | BinaryIO
 
 
 def is_url(path: str) -> bool:
     """Check if a string looks like a remote URL."""
-    lowered = path.lower()
-    return lowered.startswith(("http://", "https://")) or lowered.startswith(_SELECTOR_PREFIXES)
+    return _REMOTE_PREFIX_RE.match(path) is not None
 
 
 def normalize_intake_selector(selector: str) -> str:
@@ -69,35 +115,21 @@ def fetch_bundle(url: str) -> Path:
     candidates = _candidate_archive_urls(normalized)
     last_error: Exception | None = None
 
-    with httpx.Client(timeout=_TIMEOUT, follow_redirects=True) as client:
-        for candidate in candidates:
-            try:
-                response = client.get(candidate)
-                response.raise_for_status()
-            except Exception as exc:
-                last_error = exc
-                continue
-
-            content = response.content
-            if len(content) > _MAX_DOWNLOAD_SIZE:
-                raise ValueError(
-                    f"Download exceeds maximum size: {len(content)} > {_MAX_DOWNLOAD_SIZE}"
-                )
-
-            tmp_dir = Path(tempfile.mkdtemp(prefix="skillgate-remote-"))
-            try:
-                content_type = response.headers.get("content-type", "")
-                _extract_response_content(content, content_type, candidate)
-                _extract_to_dir(content, content_type, candidate, tmp_dir)
-            except Exception as exc:
-                last_error = exc
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-                continue
-
-            entries = list(tmp_dir.iterdir())
-            if len(entries) == 1 and entries[0].is_dir():
-                return entries[0]
-            return tmp_dir
+    client = _shared_client()
+    for candidate in _ordered_candidates(client, candidates):
+        try:
+            with client.stream("GET", candidate) as response:
+                try:
+                    response.raise_for_status()
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                return _extract_response(response, candidate)
+        except _DownloadTooLargeError:
+            raise
+        except Exception as exc:
+            last_error = exc
+            continue
 
     candidate_list = ", ".join(candidates[:6])
     detail = f": {last_error}" if last_error is not None else ""
@@ -107,12 +139,172 @@ def fetch_bundle(url: str) -> Path:
     )
 
 
-def _normalize_url(url: str) -> str:
-    """Normalize GitHub/GitLab repository URLs to downloadable archives."""
-    if url.endswith((".tar.gz", ".tgz", ".zip")):
+@lru_cache(maxsize=1)
+def _shared_client() -> httpx.Client:
+    """Return the process-wide client used for bundle downloads.
+
+    Fleet scans fetch many bundles from the same few hosts, so keeping one
+    pooled client alive lets later fetches skip the TCP and TLS handshakes.
+    """
+    return httpx.Client(
+        timeout=_TIMEOUT,
+        follow_redirects=True,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def _ordered_candidates(client: httpx.Client, candidates: list[str]) -> Iterator[str]:
+    """Yield candidates to download, probing the fallbacks only when needed.
+
+    The most likely candidate is yielded first with no probe, so a fetch that
+    succeeds on it costs a single request. Only if the caller asks for more are
+    the remaining guesses probed with concurrent HEAD requests (roughly one
+    round trip for all of them). Candidates that answered the probe come
+    next, then ones whose probe was inconclusive; definite misses are skipped.
+    """
+    if not candidates:
+        return
+    yield candidates[0]
+    fallbacks = candidates[1:]
+    if not fallbacks:
+        return
+
+    def probe(candidate: str) -> bool | None:
+        try:
+            response = client.head(candidate)
+        except httpx.HTTPError:
+            return None
+        if response.is_success:
+            return True
+        return False if response.status_code in _PROBE_MISS_STATUSES else None
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(fallbacks))) as executor:
+        outcomes = list(executor.map(probe, fallbacks))
+    yield from (c for c, found in zip(fallbacks, outcomes, strict=True) if found)
+    yield from (c for c, found in zip(fallbacks, outcomes, strict=True) if found is None)
+
+
+class _DownloadTooLargeError(ValueError):
+    """Raised when a download exceeds ``_MAX_DOWNLOAD_SIZE``."""
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only file adapter over a streaming httpx response body.
+
+    httpx has no raw file-like object, so this exposes ``iter_bytes`` through
+    ``readinto`` and enforces the download size limit as bytes arrive.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.iter_bytes(chunk_size=_STREAM_CHUNK_SIZE)
+        self._pending = b""
+        self._received = 0
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+            self._received += len(self._pending)
+            if self._received > _MAX_DOWNLOAD_SIZE:
+                raise _DownloadTooLargeError(
+                    f"Download exceeds maximum size: {self._received} > {_MAX_DOWNLOAD_SIZE}"
+                )
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+
+def _extract_response(response: httpx.Response, source_url: str) -> Path:
+    """Extract a streaming archive response into a new temp directory."""
+    declared = response.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > _MAX_DOWNLOAD_SIZE:
+        raise _DownloadTooLargeError(
+            f"Download exceeds maximum size: {declared} > {_MAX_DOWNLOAD_SIZE}"
+        )
+
+    stream = io.BufferedReader(_ResponseStream(response), buffer_size=_STREAM_CHUNK_SIZE)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="skillgate-remote-", dir=_extraction_root()))
+    try:
+        if stream.peek(len(_GZIP_MAGIC)).startswith(_GZIP_MAGIC):
+            # Download, gunzip and extraction overlap; nothing is buffered whole.
+            _extract_tar_stream(stream, tmp_dir)
+        else:
+            _extract_buffered(stream, source_url, tmp_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    entries = list(tmp_dir.iterdir())
+    if len(entries) == 1 and entries[0].is_dir():
+        return entries[0]
+    return tmp_dir
+
+
+def _extraction_root() -> str | None:
+    """Return a RAM-backed directory for extraction, or None for the default.
+
+    ``/dev/shm`` is used only when ``SKILLGATE_EXTRACT_TMPFS`` is set and it
+    has room for a worst-case bundle; container defaults (often 64MB) fall
+    back to disk.
+    """
+    opted_in = os.environ.get(_TMPFS_ENV, "").strip().lower() in {"1", "true", "yes"}
+    if not opted_in or not os.access(_TMPFS_ROOT, os.W_OK):
+        return None
+    try:
+        free = shutil.disk_usage(_TMPFS_ROOT).free
+    except OSError:
+        return None
+    return _TMPFS_ROOT if free >= _MAX_ARCHIVE_TOTAL_UNCOMPRESSED else None
+
+
+def _extract_buffered(stream: BinaryIO, source_url: str, target: Path) -> None:
+    """Extract a payload that needs random access (zip or unknown format).
+
+    Large payloads are spooled to a temp file that the archive readers seek
+    into directly, so the page cache rather than the Python heap holds them.
+    """
+    with tempfile.TemporaryFile() as spool:
+        shutil.copyfileobj(stream, spool, _STREAM_CHUNK_SIZE)
+        size = spool.tell()
+        spool.seek(0)
+        if size <= _SPOOL_THRESHOLD:
+            _extract_to_dir(spool.read(), source_url, target)
+            return
+        _extract_to_dir(spool, source_url, target)
+
+
+def _archive_fileobj(data: _ArchiveData) -> BinaryIO:
+    if isinstance(data, bytes):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
+
+
+def _normalize_url(url: str, parsed: ParseResult | None = None) -> str:
+    """Normalize GitHub/GitLab repository URLs to downloadable archives.
+
+    Callers that already parsed ``url`` can pass the result to skip a re-parse.
+    """
+    if _ARCHIVE_SUFFIX_RE.search(url):
         return url
 
-    parsed = urlparse(url)
+    if parsed is None:
+        parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
     if not host:
         return url
@@ -138,13 +330,13 @@ def _normalize_url(url: str) -> str:
 
 
 def _candidate_archive_urls(url: str) -> list[str]:
-    normalized = _normalize_url(url)
+    if _ARCHIVE_SUFFIX_RE.search(url):
+        return [url]
+    parsed = urlparse(url)
+    normalized = _normalize_url(url, parsed)
     if normalized != url:
         return [normalized]
-    if normalized.endswith((".tar.gz", ".tgz", ".zip")):
-        return [normalized]
 
-    parsed = urlparse(normalized)
     if not parsed.scheme or not parsed.netloc:
         return [normalized]
 
@@ -153,52 +345,28 @@ def _candidate_archive_urls(url: str) -> list[str]:
     if len(segments) < 2:
         return [normalized]
 
-    repo_name = segments[-1]
     base = f"{parsed.scheme}://{parsed.netloc}/{'/'.join(segments)}"
-    refs = ("main", "master", "HEAD")
-    candidates = [normalized]
-    for ref in refs:
-        quoted_ref = quote(ref, safe="")
-        candidates.extend(
-            (
-                f"{base}/archive/refs/heads/{quoted_ref}.tar.gz",
-                f"{base}/archive/{quoted_ref}.tar.gz",
-                f"{base}/-/archive/{quoted_ref}/{repo_name}-{quoted_ref}.tar.gz",
-                f"{base}/get/{quoted_ref}.tar.gz",
-            )
-        )
     # preserve order while removing duplicates
-    return list(dict.fromkeys(candidates))
-
-
-def _extract_response_content(content: bytes, content_type: str, url: str) -> None:
-    # Fast format sanity check prior to extraction to reduce noisy archive attempts.
-    url_lower = url.lower()
-    if (
-        url_lower.endswith(".tar.gz")
-        or url_lower.endswith(".tgz")
-        or "gzip" in content_type
-        or "tar" in content_type
-    ):
-        return
-    if url_lower.endswith(".zip") or "zip" in content_type:
-        return
-    # Unknown type is still allowed; _extract_to_dir tries tar then zip deterministically.
-    if len(content) < 4:
-        raise ValueError("Downloaded payload is too small to be a valid archive.")
-
-
-def _extract_to_dir(content: bytes, content_type: str, source_url: str, target: Path) -> None:
-    url_lower = source_url.lower()
-    if (
-        url_lower.endswith(".tar.gz")
-        or url_lower.endswith(".tgz")
-        or "gzip" in content_type
-        or "tar" in content_type
-    ):
+    return list(dict.fromkeys(_iter_candidate_urls(normalized, base, segments[-1])))
+
+
+def _iter_candidate_urls(normalized: str, base: str, repo_name: str) -> Iterator[str]:
+    """Yield archive URL guesses for common forge layouts, most likely first."""
+    yield normalized
+    for ref in _CANDIDATE_REFS:
+        yield f"{base}/archive/refs/heads/{ref}.tar.gz"
+        yield f"{base}/archive/{ref}.tar.gz"
+        yield f"{base}/-/archive/{ref}/{repo_name}-{ref}.tar.gz"
+        yield f"{base}/get/{ref}.tar.gz"
+
+
+def _extract_to_dir(content: _ArchiveData, source_url: str, target: Path) -> None:
+    # Dispatch on magic bytes; fall back to trying tar then zip deterministically.
+    head = _archive_fileobj(content).read(len(_ZIP_MAGIC))
+    if head.startswith(_GZIP_MAGIC):
         _extract_tar(content, target)
         return
-    if url_lower.endswith(".zip") or "zip" in content_type:
+    if head == _ZIP_MAGIC:
         _extract_zip(content, target)
         return
     try:
@@ -277,50 +445,128 @@ def _extract_gitlab_repo_and_branch(path: str) -> tuple[str | None, str | None]:
     return "/".join(segments), None
 
 
-def _extract_tar(data: bytes, target: Path) -> None:
+def _extract_tar(data: _ArchiveData, target: Path) -> None:
     """Extract a tar.gz archive to the target directory."""
-    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
-        members = tar.getmembers()
-        _validate_member_limits(members)
-        total_uncompressed = 0
-        for member in members:
+    # Streaming mode decodes the gzip stream once; validation is fused into extraction.
+    _extract_tar_stream(_archive_fileobj(data), target)
+
+
+def _extract_tar_stream(stream: BinaryIO, target: Path) -> None:
+    """Extract a tar.gz stream member-by-member, validating each before extraction.
+
+    Only directories and regular files are accepted. File contents are copied
+    chunk by chunk and the compression ratio is checked before each chunk is
+    written, so a bomb is rejected before its expanded bytes reach the disk.
+    """
+    root = os.path.normpath(target)
+    with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+        declared_total = 0
+        written_total = 0
+        for member_count, member in enumerate(tar, start=1):
+            _validate_member_count(member_count)
             _validate_archive_member_path(member.name)
             if member.issym() or member.islnk():
                 raise ValueError(f"Symlink member is not allowed: {member.name}")
-            if member.isfile():
-                total_uncompressed += max(member.size, 0)
-            if total_uncompressed > _MAX_ARCHIVE_TOTAL_UNCOMPRESSED:
+            if not (member.isdir() or member.isreg()):
+                raise ValueError(f"Unsupported member type in archive: {member.name}")
+            dest = _member_destination(root, member.name, is_dir=member.isdir())
+            if member.isdir():
+                os.makedirs(dest, exist_ok=True)
+                continue
+            declared_total += max(member.size, 0)
+            if declared_total > _MAX_ARCHIVE_TOTAL_UNCOMPRESSED:
                 raise ValueError("Archive exceeds uncompressed size safety limit.")
-        try:
-            # Python 3.12+ supports extraction filters.
-            tar.extractall(path=target, filter="data")
-        except TypeError:
-            # Older Python versions do not support `filter`; path checks above still apply.
-            tar.extractall(path=target)
+            src = tar.extractfile(member)
+            if src is None:
+                raise ValueError(f"Unreadable member in archive: {member.name}")
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            with src, open(dest, "wb") as dst:
+                while chunk := src.read(_STREAM_CHUNK_SIZE):
+                    written_total += len(chunk)
+                    # The gzip stream has no per-member sizes; compare against
+                    # compressed bytes consumed so far.
+                    _validate_compression_ratio(
+                        written_total,
+                        stream.tell(),
+                        _MAX_ARCHIVE_COMPRESSION_RATIO,
+                        floor=_STREAM_COMPRESSION_RATIO_FLOOR,
+                    )
+                    dst.write(chunk)
+
+
+def _member_destination(root: str, name: str, *, is_dir: bool) -> str:
+    """Return the normalized path an archive member extracts to under ``root``.
+
+    A directory entry may name ``root`` itself (``./``); anything else must
+    resolve strictly inside it.
+    """
+    dest = os.path.normpath(os.path.join(root, name))
+    if dest.startswith(root + os.sep) or (is_dir and dest == root):
+        return dest
+    raise ValueError(f"Unsafe path in archive: {name}")
 
 
-def _extract_zip(data: bytes, target: Path) -> None:
+def _extract_zip(data: _ArchiveData, target: Path) -> None:
     """Extract a zip archive to the target directory."""
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+    with zipfile.ZipFile(_archive_fileobj(data)) as zf:
         infos = zf.infolist()
-        _validate_member_limits(infos)
+        _validate_member_count(len(infos))
         total_uncompressed = 0
+        total_compressed = 0
         for info in infos:
             _validate_archive_member_path(info.filename)
             if _is_zip_symlink(info):
                 raise ValueError(f"Symlink member is not allowed: {info.filename}")
+            _validate_compression_ratio(
+                info.file_size, info.compress_size, _MAX_MEMBER_COMPRESSION_RATIO
+            )
             total_uncompressed += max(info.file_size, 0)
+            total_compressed += max(info.compress_size, 0)
             if total_uncompressed > _MAX_ARCHIVE_TOTAL_UNCOMPRESSED:
                 raise ValueError("Archive exceeds uncompressed size safety limit.")
-        zf.extractall(path=target)
+        _validate_compression_ratio(
+            total_uncompressed, total_compressed, _MAX_ARCHIVE_COMPRESSION_RATIO
+        )
+        _extract_zip_members(zf, infos, target)
+
+
+def _extract_zip_members(zf: zipfile.ZipFile, infos: list[zipfile.ZipInfo], target: Path) -> None:
+    """Stream each validated zip member to disk through a 64 KiB copy buffer."""
+    root = os.path.normpath(target)
+    for info in infos:
+        dest = _member_destination(root, info.filename, is_dir=info.is_dir())
+        if info.is_dir():
+            os.makedirs(dest, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with zf.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, _STREAM_CHUNK_SIZE)
+
+
+def _validate_compression_ratio(
+    uncompressed: int,
+    compressed: int,
+    max_ratio: int,
+    *,
+    floor: int = _COMPRESSION_RATIO_FLOOR,
+) -> None:
+    if uncompressed <= floor:
+        return
+    if uncompressed > max(compressed, 1) * max_ratio:
+        raise ValueError(
+            f"Archive compression ratio exceeds safety limit ({max_ratio}:1); "
+            "possible decompression bomb."
+        )
 
 
-def _validate_member_limits(members: list[tarfile.TarInfo] | list[zipfile.ZipInfo]) -> None:
-    if len(members) > _MAX_ARCHIVE_MEMBERS:
-        raise ValueError(f"Archive exceeds member limit: {len(members)} > {_MAX_ARCHIVE_MEMBERS}")
+def _validate_member_count(count: int) -> None:
+    if count > _MAX_ARCHIVE_MEMBERS:
+        raise ValueError(f"Archive exceeds member limit: {count} > {_MAX_ARCHIVE_MEMBERS}")
 
 
 def _validate_archive_member_path(member_name: str) -> None:
+    if _SAFE_MEMBER_PATH_RE.fullmatch(member_name):
+        return
     normalized = member_name.replace("\\", "/")
     parsed = urlparse(normalized)
     path = parsed.path if parsed.scheme else normalized
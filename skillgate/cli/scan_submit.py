@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+import gzip
+import importlib.util
+import json
 import os
+from functools import lru_cache
+from typing import Any, Final
 from urllib.parse import urljoin
 
 import httpx
+from pydantic import BaseModel
 
 from skillgate.cli.commands.auth import get_api_key, get_bearer_token
 from skillgate.core.errors import SkillGateError
 
+try:  # Optional fast encoder: pip install 'skillgate[speedups]'
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None  # type: ignore[assignment]
 
+_SUBMIT_TIMEOUT: Final[float] = 20.0
+_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 8
+_GZIP_MIN_BYTES: Final[int] = 16 * 1024
+_GZIP_LEVEL: Final[int] = 3
+_GZIP_ENV: Final[str] = "SKILLGATE_SUBMIT_GZIP"
+# Answers from an API or proxy that could not read a gzip-encoded body.
+_GZIP_REJECTED_STATUSES: Final[frozenset[int]] = frozenset({400, 415, 422})
+# HTTP/2 needs the optional ``h2`` package (installed with the speedups extra).
+_HTTP2_AVAILABLE: Final[bool] = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
 def resolve_scan_submit_endpoint() -> str:
-    """Resolve API endpoint for scan report submission."""
+    """Resolve API endpoint for scan report submission.
+
+    The result is cached for the life of the process; changes to
+    ``SKILLGATE_API_URL`` or ``SKILLGATE_ENV`` take effect on restart, or
+    after ``resolve_scan_submit_endpoint.cache_clear()``.
+    """
     configured_base = os.environ.get("SKILLGATE_API_URL") or os.environ.get("NEXT_PUBLIC_API_URL")
     if configured_base:
         raw_base = configured_base.strip()
@@ -42,10 +69,16 @@ def resolve_scan_submit_endpoint() -> str:
 
 def submit_scan_report(
     *,
-    report: dict[str, object],
+    report: BaseModel | dict[str, object],
     bearer_token: str | None = None,
 ) -> str:
-    """Submit a scan report to hosted API and return created scan_id."""
+    """Submit a scan report to hosted API and return created scan_id.
+
+    Models are serialized straight to JSON bytes, skipping the intermediate
+    dict tree that ``model_dump()`` would build for large fleet reports.
+    With ``SKILLGATE_SUBMIT_GZIP=1``, larger bodies are sent gzip-encoded and
+    resent as plain JSON if the API rejects them with 400, 415 or 422.
+    """
     token = bearer_token or get_bearer_token() or get_api_key()
     if not token:
         raise SkillGateError(
@@ -54,15 +87,24 @@ def submit_scan_report(
         )
 
     endpoint = resolve_scan_submit_endpoint()
-    payload = {"report": report}
+    body_bytes = _encode_submit_payload(report)
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    content = body_bytes
+    if len(body_bytes) >= _GZIP_MIN_BYTES and _gzip_enabled():
+        content = gzip.compress(body_bytes, compresslevel=_GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
 
     try:
-        resp = httpx.post(
-            endpoint,
-            json=payload,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=20.0,
-        )
+        client = _submit_client()
+        resp = client.post(endpoint, content=content, headers=headers)
+        if resp.status_code in _GZIP_REJECTED_STATUSES and "Content-Encoding" in headers:
+            # API or proxy did not accept the compressed body; resend uncompressed.
+            del headers["Content-Encoding"]
+            resp = client.post(endpoint, content=body_bytes, headers=headers)
     except httpx.HTTPError as exc:
         raise SkillGateError(
             "Failed to submit scan report: "
@@ -75,7 +117,7 @@ def submit_scan_report(
     if resp.status_code >= 400:
         detail = ""
         try:
-            data = resp.json()
+            data = _decode_json(resp.content)
             detail = str(data.get("detail") or data.get("message") or "")
         except Exception:
             detail = resp.text[:200]
@@ -83,8 +125,39 @@ def submit_scan_report(
             f"Scan submission failed ({resp.status_code})" + (f": {detail}" if detail else "")
         )
 
-    body = resp.json()
+    body = _decode_json(resp.content)
     scan_id = str(body.get("scan_id", ""))
     if not scan_id:
         raise SkillGateError("Scan submission failed: missing scan_id in response")
     return scan_id
+
+
+def _gzip_enabled() -> bool:
+    """Return whether gzip request bodies were opted into via the environment."""
+    return os.environ.get(_GZIP_ENV, "").strip().lower() in {"1", "true", "yes"}
+
+
+def _encode_submit_payload(report: BaseModel | dict[str, object]) -> bytes:
+    """Encode the ``{"report": ...}`` submission envelope as JSON bytes."""
+    if isinstance(report, BaseModel):
+        return b'{"report":' + report.model_dump_json().encode("utf-8") + b"}"
+    if orjson is not None:
+        return orjson.dumps({"report": report})
+    return json.dumps({"report": report}).encode("utf-8")
+
+
+def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=1)
+def _submit_client() -> httpx.Client:
+    """Return the process-wide client reused across report submissions."""
+    return httpx.Client(
+        timeout=_SUBMIT_TIMEOUT,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+    )
@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OriginType(str, Enum):
@@ -23,6 +23,8 @@ class OriginType(str, Enum):
 class ArtifactProvenance(BaseModel):
     """Canonical provenance schema for extracted or analyzed artifacts."""
 
+    model_config = ConfigDict(frozen=True)
+
     origin_type: OriginType = Field(description="Classification of artifact source/origin")
     source_file: str = Field(description="Original file path within bundle")
     section: str | None = Field(default=None, description="Section/heading/page identifier")
@@ -44,6 +46,8 @@ class ArtifactProvenance(BaseModel):
 class ExtractedArtifact(BaseModel):
     """A virtual source unit extracted from markdown/documents/archives."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(description="Extracted content (code block, text, config)")
     provenance: ArtifactProvenance = Field(description="Source mapping and context")
     is_executable: bool = Field(
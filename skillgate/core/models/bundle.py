@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
 from skillgate.core.models.enums import Language
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 class SourceFile(BaseModel):
     """A source file within a skill bundle."""
@@ -15,7 +21,23 @@ class SourceFile(BaseModel):
     path: str = Field(description="Relative path within bundle")
     language: Language
     content: str = Field(description="Raw file content")
-    lines: list[str] = Field(default_factory=list, description="Split lines")
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Return content split into lines, computed on first access."""
+        return self.content.splitlines()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, dropping cached ``lines`` if ``content`` changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "content" in update:
+            copied.__dict__.pop("lines", None)
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "content":
+            self.__dict__.pop("lines", None)
 
 
 class SkillManifest(BaseModel):
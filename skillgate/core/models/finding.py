@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from skillgate.core.models.enums import Category, Severity
 
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class FindingLocation(BaseModel):
     """Canonical file location for a finding."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str = Field(description="Relative file path within the bundle")
     line_start: int = Field(ge=1, description="Start line (1-based)")
     line_end: int = Field(ge=1, description="End line (1-based)")
@@ -4,8 +4,11 @@ from skillgate.core.signer.canonical import canonical_json, hash_canonical
 from skillgate.core.signer.engine import (
     create_signed_report,
     sign_report,
+    sign_reports_batched,
     verify_report,
     verify_report_with_key,
+    verify_reports_batch,
+    verify_reports_parallel,
 )
 from skillgate.core.signer.keys import generate_keypair, load_public_key_hex, load_signing_key
 
@@ -17,6 +20,9 @@ __all__ = [
     "load_public_key_hex",
     "load_signing_key",
     "sign_report",
+    "sign_reports_batched",
     "verify_report",
     "verify_report_with_key",
+    "verify_reports_batch",
+    "verify_reports_parallel",
 ]
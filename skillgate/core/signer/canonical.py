@@ -4,7 +4,25 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, Protocol, cast
+
+try:  # Optional fast hash: pip install 'skillgate[speedups]'
+    import blake3  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on optional dependency
+    blake3 = None  # type: ignore[assignment, unused-ignore]
+
+DEFAULT_HASH_ALGO = "sha256"
+HASH_ALGORITHMS: tuple[str, ...] = ("sha256", "blake3")
+
+# Containers nested up to this depth are streamed member by member; anything
+# deeper (a single finding, say) is encoded whole by the C JSON encoder.
+_STREAM_DEPTH = 3
+# Array members are encoded in slices of this many to amortize per-call cost.
+_STREAM_BATCH = 256
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+# Top-level report keys outside the signing scope (added after signing).
+_SIGNING_SCOPE_EXCLUDED: frozenset[str] = frozenset({"attestation"})
 
 
 def canonical_json(data: dict[str, Any]) -> str:
@@ -16,9 +34,92 @@ def canonical_json(data: dict[str, Any]) -> str:
 
 
 def hash_canonical(data: dict[str, Any]) -> str:
-    """Produce SHA-256 hex digest of canonical JSON representation."""
-    canonical = canonical_json(data)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    """Produce SHA-256 hex digest of canonical JSON representation.
+
+    The canonical form is fed to the hasher in pieces, so the full document
+    is never held in memory; the digest equals hashing ``canonical_json``.
+    """
+    hasher = hashlib.sha256()
+    for chunk in _iter_canonical(data, 0):
+        # Canonical JSON escapes non-ASCII, so the ASCII codec is exact and fastest.
+        hasher.update(chunk.encode("ascii"))
+    return hasher.hexdigest()
+
+
+def hash_signing_scope(report_dict: dict[str, Any], hash_algo: str = DEFAULT_HASH_ALGO) -> str:
+    """Hash the signing scope of ``report_dict`` without building it.
+
+    With the default SHA-256 this equals
+    ``hash_canonical(build_signing_scope(report_dict))``; the ``attestation``
+    key is skipped while encoding instead of copying the dict.
+
+    Raises:
+        ValueError: If ``hash_algo`` is unknown or its backend is not installed.
+    """
+    return signing_scope_digest(report_dict, hash_algo).hex()
+
+
+def signing_scope_digest(report_dict: dict[str, Any], hash_algo: str = DEFAULT_HASH_ALGO) -> bytes:
+    """Raw-digest counterpart of ``hash_signing_scope``.
+
+    Raises:
+        ValueError: If ``hash_algo`` is unknown or its backend is not installed.
+    """
+    hasher = _new_hasher(hash_algo)
+    if all(isinstance(k, str) for k in report_dict):
+        chunks = _iter_canonical(report_dict, 0, _SIGNING_SCOPE_EXCLUDED)
+    else:
+        chunks = iter((canonical_json(build_signing_scope(report_dict)),))
+    for chunk in chunks:
+        hasher.update(chunk.encode("ascii"))
+    return hasher.digest()
+
+
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> object: ...
+
+    def digest(self) -> bytes: ...
+
+
+def _new_hasher(hash_algo: str) -> _Hasher:
+    if hash_algo == "sha256":
+        return hashlib.sha256()
+    if hash_algo == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 report hashing requires: pip install 'skillgate[speedups]'")
+        return cast(_Hasher, blake3.blake3())
+    raise ValueError(f"Unsupported report hash algorithm: {hash_algo}")
+
+
+def _iter_canonical(
+    value: Any, depth: int, excluded: frozenset[str] = frozenset()
+) -> Iterator[str]:
+    """Yield ``canonical_json(value)`` in pieces that concatenate to it exactly.
+
+    Top-level keys listed in ``excluded`` are left out, as if absent.
+    """
+    if depth < _STREAM_DEPTH and isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        yield "{"
+        members = sorted(value.items())
+        if excluded:
+            members = [(key, item) for key, item in members if key not in excluded]
+        for index, (key, item) in enumerate(members):
+            yield f",{_dumps(key)}:" if index else f"{_dumps(key)}:"
+            yield from _iter_canonical(item, depth + 1)
+        yield "}"
+    elif depth < _STREAM_DEPTH and isinstance(value, (list, tuple)):
+        yield "["
+        for start in range(0, len(value), _STREAM_BATCH):
+            # Encoding a slice and dropping its brackets yields comma-joined members.
+            chunk = _dumps(value[start : start + _STREAM_BATCH])[1:-1]
+            yield f",{chunk}" if start else chunk
+        yield "]"
+    else:
+        yield _dumps(value)
+
+
+def _dumps(value: Any) -> str:
+    return _ENCODER.encode(value)
 
 
 def build_signing_scope(report_dict: dict[str, Any]) -> dict[str, Any]:
@@ -41,4 +142,4 @@ def build_signing_scope(report_dict: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Filtered dict ready for ``hash_canonical()``.
     """
-    return {k: v for k, v in report_dict.items() if k != "attestation"}
+    return {k: v for k, v in report_dict.items() if k not in _SIGNING_SCOPE_EXCLUDED}
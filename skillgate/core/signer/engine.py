@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import binascii
+import hmac
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +15,24 @@ from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
 from skillgate.core.errors import SigningError
-from skillgate.core.signer.canonical import build_signing_scope, canonical_json, hash_canonical
+from skillgate.core.signer.canonical import (
+    DEFAULT_HASH_ALGO,
+    HASH_ALGORITHMS,
+    canonical_json,
+    signing_scope_digest,
+)
 from skillgate.core.signer.keys import load_public_key_hex, load_signing_key, public_key_from_hex
+from skillgate.core.signer.merkle import build_levels, inclusion_proof, leaf_hash, root_from_proof
 
+_SIGNATURE_BYTES = 64
 
-def sign_report(report_data: dict[str, Any], key_dir: Path | None = None) -> dict[str, Any]:
+
+def sign_report(
+    report_data: dict[str, Any],
+    key_dir: Path | None = None,
+    *,
+    hash_algo: str = DEFAULT_HASH_ALGO,
+) -> dict[str, Any]:
     """Sign a scan report and return attestation block.
 
     The attestation block contains:
@@ -22,26 +40,76 @@ def sign_report(report_data: dict[str, Any], key_dir: Path | None = None) -> dic
     - timestamp: ISO 8601 UTC timestamp of signing
     - public_key: hex-encoded Ed25519 public key
     - signature: hex-encoded Ed25519 signature of the report hash
+    - hash_algo: only when a non-default ``hash_algo`` (e.g. ``"blake3"``)
+      is used, naming the algorithm behind report_hash
 
     Returns the attestation dict to be added to the report.
     """
+    # Hash the report without attestation field
+    try:
+        report_digest = signing_scope_digest(report_data, hash_algo)
+    except ValueError as e:
+        raise SigningError(str(e)) from e
+    return _attest_digest(report_digest, key_dir, hash_algo)
+
+
+def _attest_digest(digest: bytes, key_dir: Path | None, hash_algo: str) -> dict[str, Any]:
     signing_key = load_signing_key(key_dir)
     public_key_hex = load_public_key_hex(key_dir)
 
-    # Hash the report without attestation field
-    signable = build_signing_scope(report_data)
-    report_hash = hash_canonical(signable)
-
-    # Sign the hash
-    signed = signing_key.sign(report_hash.encode("utf-8"))
+    # The signed message is the ASCII hex digest, as in every existing attestation;
+    # hexlify produces those bytes directly instead of encoding a hex string.
+    report_hash = binascii.hexlify(digest)
+    signed = signing_key.sign(report_hash)
     signature_hex = signed.signature.hex()
 
-    return {
-        "report_hash": report_hash,
+    attestation = {
+        "report_hash": report_hash.decode("ascii"),
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "public_key": public_key_hex,
         "signature": signature_hex,
     }
+    if hash_algo != DEFAULT_HASH_ALGO:
+        # Omitted for SHA-256 so default attestations stay readable by older verifiers.
+        attestation["hash_algo"] = hash_algo
+    return attestation
+
+
+def sign_reports_batched(
+    reports: Sequence[dict[str, Any]],
+    key_dir: Path | None = None,
+    *,
+    hash_algo: str = DEFAULT_HASH_ALGO,
+) -> list[dict[str, Any]]:
+    """Sign many reports with one Ed25519 signature over a Merkle root.
+
+    Each report hash becomes a leaf of a SHA-256 Merkle tree and only the
+    root is signed, so a CI run emitting N reports pays for one signature.
+    Every returned attestation (one per report, in order) carries the usual
+    fields plus:
+    - merkle_root: hex root of the batch tree; ``signature`` signs this
+    - merkle_proof: sibling hashes leading from the report's leaf to the root
+
+    ``verify_report`` accepts these attestations alongside single ones.
+    """
+    if not reports:
+        return []
+    try:
+        report_digests = [signing_scope_digest(report, hash_algo) for report in reports]
+    except ValueError as e:
+        raise SigningError(str(e)) from e
+    levels = build_levels([leaf_hash(digest) for digest in report_digests])
+
+    root_attestation = _attest_digest(levels[-1][0], key_dir, hash_algo)
+    merkle_root = root_attestation["report_hash"]
+    attestations = []
+    for index, report_digest in enumerate(report_digests):
+        attestation = dict(root_attestation)
+        attestation["report_hash"] = report_digest.hex()
+        attestation["merkle_root"] = merkle_root
+        attestation["merkle_proof"] = inclusion_proof(levels, index)
+        attestations.append(attestation)
+    return attestations
 
 
 def verify_report(report_data: dict[str, Any]) -> bool:
@@ -50,91 +118,196 @@ def verify_report(report_data: dict[str, Any]) -> bool:
     Checks that:
     1. The attestation block exists
     2. The report hash matches recomputed hash
-    3. The Ed25519 signature is valid
+    3. The Ed25519 signature is valid (for batch attestations, the Merkle
+       proof leads to ``merkle_root`` and the signature covers that root)
 
     Returns True if verification passes.
     Raises SigningError on verification failure.
     """
+    attestation = _require_attestation(
+        report_data, {"report_hash", "public_key", "signature", "timestamp"}
+    )
+    return _verify_attestation(
+        report_data,
+        attestation,
+        attestation["public_key"],
+        "Invalid signature: report has been tampered with",
+    )
+
+
+def verify_report_with_key(report_data: dict[str, Any], public_key_hex: str) -> bool:
+    """Verify a signed report using an explicit public key.
+
+    Same as verify_report but uses the provided key instead of the one
+    embedded in the attestation. This is useful for third-party verification
+    where you want to check against a known trusted key.
+    """
+    attestation = _require_attestation(report_data, {"report_hash", "signature"})
+    return _verify_attestation(
+        report_data,
+        attestation,
+        public_key_hex,
+        "Invalid signature: key mismatch or tampering",
+    )
+
+
+def _require_attestation(report_data: dict[str, Any], required_fields: set[str]) -> dict[str, Any]:
     attestation = report_data.get("attestation")
     if not attestation or not isinstance(attestation, dict):
         raise SigningError("Report has no attestation block")
 
-    required_fields = {"report_hash", "public_key", "signature", "timestamp"}
     missing = required_fields - set(attestation.keys())
     if missing:
         raise SigningError(f"Attestation missing fields: {', '.join(sorted(missing))}")
+    return attestation
+
 
+def _verify_attestation(
+    report_data: dict[str, Any],
+    attestation: dict[str, Any],
+    public_key_hex: str,
+    bad_signature_message: str,
+) -> bool:
+    """Recompute the report hash once and check it and its signature."""
     # Recompute hash from report data (excluding attestation)
-    signable = build_signing_scope(report_data)
-    recomputed_hash = hash_canonical(signable)
+    hash_algo = attestation.get("hash_algo", DEFAULT_HASH_ALGO)
+    if hash_algo not in HASH_ALGORITHMS:
+        raise SigningError(f"Unsupported report hash algorithm: {hash_algo}")
+    try:
+        recomputed_digest = signing_scope_digest(report_data, hash_algo)
+    except ValueError as e:
+        raise SigningError(str(e)) from e
+    recomputed_hash = binascii.hexlify(recomputed_digest)
 
-    if recomputed_hash != attestation["report_hash"]:
+    if not _hex_digest_matches(recomputed_hash, attestation["report_hash"]):
         raise SigningError("Report hash mismatch: report has been tampered with")
 
-    # Verify Ed25519 signature
-    public_key_bytes = public_key_from_hex(attestation["public_key"])
-    verify_key = VerifyKey(public_key_bytes)
+    public_key_bytes = public_key_from_hex(public_key_hex)
+    if "merkle_root" in attestation:
+        merkle_root = _check_merkle_proof(recomputed_digest, attestation)
+        if not isinstance(attestation["signature"], str):
+            raise SigningError("Invalid signature: expected a hex string")
+        # Every report in a batch shares one root signature; check it once.
+        valid = _root_signature_valid(public_key_bytes, merkle_root, attestation["signature"])
+        if not valid:
+            raise SigningError(bad_signature_message)
+        return True
 
-    try:
-        signature_bytes = bytes.fromhex(attestation["signature"])
-    except ValueError as e:
-        raise SigningError(f"Invalid signature hex: {e}") from e
+    # Verify Ed25519 signature
+    verify_key = _verify_key(public_key_bytes)
+    signature_bytes = _decode_signature(attestation["signature"])
 
     try:
-        verify_key.verify(
-            recomputed_hash.encode("utf-8"),
-            signature_bytes,
-        )
+        verify_key.verify(recomputed_hash, signature_bytes)
     except BadSignatureError as e:
-        raise SigningError("Invalid signature: report has been tampered with") from e
+        raise SigningError(bad_signature_message) from e
 
     return True
 
 
-def verify_report_with_key(report_data: dict[str, Any], public_key_hex: str) -> bool:
-    """Verify a signed report using an explicit public key.
+def _check_merkle_proof(report_digest: bytes, attestation: dict[str, Any]) -> str:
+    """Return the attested Merkle root once the report's proof leads to it."""
+    merkle_root = attestation["merkle_root"]
+    try:
+        computed_root = root_from_proof(leaf_hash(report_digest), attestation.get("merkle_proof"))
+    except ValueError as e:
+        raise SigningError(f"Invalid Merkle proof: {e}") from e
+    if not _hex_digest_matches(binascii.hexlify(computed_root), merkle_root):
+        raise SigningError("Merkle proof mismatch: report is not part of the signed batch")
+    return str(merkle_root)
 
-    Same as verify_report but uses the provided key instead of the one
-    embedded in the attestation. This is useful for third-party verification
-    where you want to check against a known trusted key.
-    """
-    attestation = report_data.get("attestation")
-    if not attestation or not isinstance(attestation, dict):
-        raise SigningError("Report has no attestation block")
 
-    # Recompute hash
-    signable = build_signing_scope(report_data)
-    recomputed_hash = hash_canonical(signable)
+def _hex_digest_matches(expected_hex: bytes, attested: Any) -> bool:
+    """Compare a hex digest against an attestation field in constant time."""
+    if not isinstance(attested, str) or not attested.isascii():
+        # compare_digest rejects non-ASCII str; such a field can never match anyway.
+        return False
+    return hmac.compare_digest(expected_hex, attested.encode("ascii"))
 
-    if recomputed_hash != attestation["report_hash"]:
-        raise SigningError("Report hash mismatch: report has been tampered with")
 
-    # Verify with provided key
-    public_key_bytes = public_key_from_hex(public_key_hex)
-    verify_key = VerifyKey(public_key_bytes)
+@lru_cache(maxsize=256)
+def _root_signature_valid(public_key_bytes: bytes, merkle_root: str, signature_hex: str) -> bool:
+    signature_bytes = _decode_signature(signature_hex)
+    try:
+        _verify_key(public_key_bytes).verify(merkle_root.encode("utf-8"), signature_bytes)
+    except BadSignatureError:
+        return False
+    return True
 
+
+def _decode_signature(signature_hex: str) -> bytes:
     try:
-        signature_bytes = bytes.fromhex(attestation["signature"])
+        signature_bytes = bytes.fromhex(signature_hex)
     except ValueError as e:
         raise SigningError(f"Invalid signature hex: {e}") from e
+    if len(signature_bytes) != _SIGNATURE_BYTES:
+        raise SigningError(
+            f"Invalid signature length: expected {_SIGNATURE_BYTES} bytes, "
+            f"got {len(signature_bytes)}"
+        )
+    return signature_bytes
 
-    try:
-        verify_key.verify(recomputed_hash.encode("utf-8"), signature_bytes)
-    except BadSignatureError as e:
-        raise SigningError("Invalid signature: key mismatch or tampering") from e
 
-    return True
+@lru_cache(maxsize=256)
+def _verify_key(public_key_bytes: bytes) -> VerifyKey:
+    """Return a shared ``VerifyKey`` per signer key; instances are immutable."""
+    return VerifyKey(public_key_bytes)
+
+
+def verify_reports_batch(
+    reports: Iterable[dict[str, Any]], public_key_hex: str | None = None
+) -> list[SigningError | None]:
+    """Verify many signed reports, returning one outcome per report.
+
+    Each entry is ``None`` when the report verified, or the ``SigningError``
+    explaining why it did not, so one bad report does not stop an audit.
+    When ``public_key_hex`` is given, every report is checked against that
+    trusted key as in ``verify_report_with_key``.
+    """
+    return [_verification_outcome(report_data, public_key_hex) for report_data in reports]
+
+
+def verify_reports_parallel(
+    reports: Iterable[dict[str, Any]],
+    public_key_hex: str | None = None,
+    max_workers: int | None = None,
+) -> list[SigningError | None]:
+    """Verify many signed reports concurrently; same results as ``verify_reports_batch``.
+
+    Reports are independent, and both SHA-256 over large buffers and PyNaCl's
+    signature check release the GIL, so a thread pool scales across cores
+    without pickling reports to worker processes.
+    """
+    outcome = partial(_verification_outcome, public_key_hex=public_key_hex)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(outcome, reports))
+
+
+def _verification_outcome(
+    report_data: dict[str, Any], public_key_hex: str | None
+) -> SigningError | None:
+    try:
+        if public_key_hex is None:
+            verify_report(report_data)
+        else:
+            verify_report_with_key(report_data, public_key_hex)
+    except SigningError as e:
+        return e
+    return None
 
 
 def create_signed_report(
-    report_data: dict[str, Any], key_dir: Path | None = None
+    report_data: dict[str, Any],
+    key_dir: Path | None = None,
+    *,
+    hash_algo: str = DEFAULT_HASH_ALGO,
 ) -> dict[str, Any]:
     """Create a complete signed report with attestation block.
 
     Takes a report dict, signs it, and returns the report with
     the attestation block added.
     """
-    attestation = sign_report(report_data, key_dir)
+    attestation = sign_report(report_data, key_dir, hash_algo=hash_algo)
     result = dict(report_data)
     result["attestation"] = attestation
 
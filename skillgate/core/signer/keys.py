@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import binascii
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from nacl.signing import SigningKey
@@ -15,6 +18,8 @@ DEFAULT_KEY_DIR = Path.home() / ".skillgate" / "keys"
 PRIVATE_KEY_FILE = "signing.key"
 PUBLIC_KEY_FILE = "signing.pub"
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
 def get_key_dir(key_dir: Path | None = None, namespace: str | None = None) -> Path:
     """Return the key directory, creating it if necessary.
@@ -26,12 +31,22 @@ def get_key_dir(key_dir: Path | None = None, namespace: str | None = None) -> Pa
     Returns:
         Path to the key directory
     """
-    base_dir = key_dir or DEFAULT_KEY_DIR
-    directory = base_dir / namespace if namespace else base_dir
+    directory = _resolve_key_dir(key_dir, namespace)
     directory.mkdir(parents=True, exist_ok=True)
     return directory
 
 
+def _resolve_key_dir(key_dir: Path | None, namespace: str | None) -> Path:
+    base_dir = key_dir or DEFAULT_KEY_DIR
+    return base_dir / namespace if namespace else base_dir
+
+
+def clear_key_cache() -> None:
+    """Forget keys loaded from disk so the next load re-reads the key files."""
+    _read_signing_key.cache_clear()
+    _read_public_key_hex.cache_clear()
+
+
 def generate_keypair(
     key_dir: Path | None = None, namespace: str | None = None
 ) -> tuple[Path, Path]:
@@ -54,13 +69,20 @@ def generate_keypair(
     signing_key = SigningKey.generate()
     verify_key = signing_key.verify_key
 
-    # Write private key (raw 32 bytes)
-    private_path.write_bytes(bytes(signing_key))
-    private_path.chmod(0o600)
+    # Write private key (raw 32 bytes); created 0o600 so it is never world-readable.
+    try:
+        fd = os.open(private_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError as e:
+        raise SigningError(
+            f"Key already exists at {private_path}. Remove it first to regenerate."
+        ) from e
+    with os.fdopen(fd, "wb") as private_file:
+        private_file.write(bytes(signing_key))
 
     # Write public key (hex-encoded for easy sharing)
     public_path.write_text(verify_key.encode().hex() + "\n", encoding="utf-8")
 
+    clear_key_cache()
     logger.info("Generated Ed25519 keypair in %s", directory)
     return private_path, public_path
 
@@ -68,13 +90,18 @@ def generate_keypair(
 def load_signing_key(key_dir: Path | None = None, namespace: str | None = None) -> SigningKey:
     """Load the private signing key from disk.
 
+    Keys are cached per file for the life of the process; see
+    ``clear_key_cache``.
+
     Args:
         key_dir: Custom key directory path
         namespace: Optional namespace for key isolation (enterprise feature)
     """
-    directory = get_key_dir(key_dir, namespace)
-    private_path = directory / PRIVATE_KEY_FILE
+    return _read_signing_key(_resolve_key_dir(key_dir, namespace) / PRIVATE_KEY_FILE)
+
 
+@lru_cache(maxsize=16)
+def _read_signing_key(private_path: Path) -> SigningKey:
     if not private_path.exists():
         raise SigningError(
             f"No signing key found at {private_path}. Run 'skillgate keys generate' first."
@@ -92,13 +119,18 @@ def load_signing_key(key_dir: Path | None = None, namespace: str | None = None)
 def load_public_key_hex(key_dir: Path | None = None, namespace: str | None = None) -> str:
     """Load the public key as hex string from disk.
 
+    Keys are cached per file for the life of the process; see
+    ``clear_key_cache``.
+
     Args:
         key_dir: Custom key directory path
         namespace: Optional namespace for key isolation (enterprise feature)
     """
-    directory = get_key_dir(key_dir, namespace)
-    public_path = directory / PUBLIC_KEY_FILE
+    return _read_public_key_hex(_resolve_key_dir(key_dir, namespace) / PUBLIC_KEY_FILE)
 
+
+@lru_cache(maxsize=16)
+def _read_public_key_hex(public_path: Path) -> str:
     if not public_path.exists():
         raise SigningError(
             f"No public key found at {public_path}. Run 'skillgate keys generate' first."
@@ -107,14 +139,17 @@ def load_public_key_hex(key_dir: Path | None = None, namespace: str | None = Non
     return public_path.read_text(encoding="utf-8").strip()
 
 
+@lru_cache(maxsize=256)
 def public_key_from_hex(hex_key: str) -> bytes:
-    """Decode a hex-encoded public key to raw bytes."""
-    try:
-        key_bytes = bytes.fromhex(hex_key)
-    except ValueError as e:
-        raise SigningError(f"Invalid hex public key: {e}") from e
+    """Decode a hex-encoded public key to raw bytes.
 
-    if len(key_bytes) != 32:
-        raise SigningError(f"Invalid public key length: expected 32 bytes, got {len(key_bytes)}")
+    Results are memoized: audits see the same few signer keys many times.
+    Malformed input is rejected by a charset check rather than a decode error.
+    """
+    if len(hex_key) % 2 or not _HEX_DIGITS.issuperset(hex_key):
+        raise SigningError("Invalid hex public key: not an even-length string of hex digits")
+
+    if len(hex_key) != 64:
+        raise SigningError(f"Invalid public key length: expected 32 bytes, got {len(hex_key) // 2}")
 
-    return key_bytes
+    return binascii.unhexlify(hex_key)
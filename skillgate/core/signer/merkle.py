@@ -0,0 +1,86 @@
+"""SHA-256 Merkle trees for signing a batch of report hashes at once.
+
+Leaves and interior nodes are domain-separated as in RFC 6962 (``0x00`` and
+``0x01`` prefixes) so a leaf can never be passed off as an interior node. A
+node without a sibling is promoted to the next level unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from typing import Any
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+_DIGEST_HEX_LEN = 64
+
+
+def leaf_hash(report_digest: bytes) -> bytes:
+    """Hash a report digest into a Merkle leaf."""
+    return hashlib.sha256(_LEAF_PREFIX + report_digest).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent."""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def build_levels(leaves: Sequence[bytes]) -> list[list[bytes]]:
+    """Build every level of the tree, from the leaves up to the single root.
+
+    Raises:
+        ValueError: If ``leaves`` is empty.
+    """
+    if not leaves:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def inclusion_proof(levels: list[list[bytes]], index: int) -> list[dict[str, str]]:
+    """Return the sibling path proving that leaf ``index`` is under the root.
+
+    Each step names the side (``"left"`` or ``"right"``) the sibling hash sits
+    on. Levels where the node is promoted without a sibling add no step.
+    """
+    proof: list[dict[str, str]] = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            position = "left" if sibling < index else "right"
+            proof.append({"position": position, "hash": level[sibling].hex()})
+        index //= 2
+    return proof
+
+
+def root_from_proof(leaf: bytes, proof: Any) -> bytes:
+    """Fold an inclusion proof over ``leaf`` and return the implied root.
+
+    Raises:
+        ValueError: If the proof is malformed.
+    """
+    if not isinstance(proof, list):
+        raise ValueError("Merkle proof must be a list")
+    node = leaf
+    for step in proof:
+        if not isinstance(step, dict):
+            raise ValueError("Merkle proof step must be an object")
+        sibling_hex = step.get("hash")
+        if not isinstance(sibling_hex, str) or len(sibling_hex) != _DIGEST_HEX_LEN:
+            raise ValueError("Merkle proof step has an invalid hash")
+        sibling = bytes.fromhex(sibling_hex)
+        position = step.get("position")
+        if position == "left":
+            node = node_hash(sibling, node)
+        elif position == "right":
+            node = node_hash(node, sibling)
+        else:
+            raise ValueError(f"Merkle proof step has an invalid position: {position!r}")
+    return node
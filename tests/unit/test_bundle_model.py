@@ -0,0 +1,36 @@
+"""Tests for the bundle data models."""
+
+from __future__ import annotations
+
+from skillgate.core.models.bundle import SourceFile
+from skillgate.core.models.enums import Language
+
+
+def _source(content: str) -> SourceFile:
+    return SourceFile(path="skill.py", language=Language.PYTHON, content=content)
+
+
+def test_lines_are_computed_once() -> None:
+    source = _source("a\nb\n")
+
+    assert source.lines == ["a", "b"]
+    assert source.lines is source.lines
+
+
+def test_lines_follow_content_of_a_copy() -> None:
+    source = _source("a\nb\n")
+    assert source.lines == ["a", "b"]
+
+    copy = source.model_copy(update={"content": "c\nd\ne"})
+
+    assert copy.lines == ["c", "d", "e"]
+    assert source.lines == ["a", "b"]
+
+
+def test_lines_follow_reassigned_content() -> None:
+    source = _source("a")
+    assert source.lines == ["a"]
+
+    source.content = "x\ny"
+
+    assert source.lines == ["x", "y"]
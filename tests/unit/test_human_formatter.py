@@ -0,0 +1,128 @@
+"""Tests for the Rich human-readable formatter."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from rich.console import Console
+
+from skillgate.cli.formatters import human
+from skillgate.cli.formatters.human import format_human
+from skillgate.core.models import RiskScore, ScanReport, Severity
+
+_ITALIC = "\x1b[3m"
+
+
+def _finding(**overrides: Any) -> dict[str, object]:
+    finding: dict[str, object] = {
+        "rule_id": "SG-EVAL-001",
+        "rule_name": "dynamic_eval",
+        "severity": "high",
+        "category": "eval",
+        "message": "Dynamic code evaluation",
+        "file": "skill.py",
+        "line": 3,
+        "snippet": "",
+        "weight": 40,
+    }
+    finding.update(overrides)
+    return finding
+
+
+def _report(findings: list[dict[str, object]], **extra: Any) -> ScanReport:
+    return ScanReport(
+        timestamp="2025-01-01T00:00:00Z",
+        risk_score=RiskScore(total=80, severity=Severity.HIGH, findings_count=len(findings)),
+        findings=findings,
+        **extra,
+    )
+
+
+def test_markup_in_snippet_does_not_style_later_lines() -> None:
+    report = _report(
+        [
+            _finding(snippet="foo[i] = 1"),
+            _finding(rule_id="SG-EVAL-002", line=7, snippet="bar()"),
+        ],
+        explanations=[{"rule_id": "SG-EVAL-001", "text": "why", "source": "catalog"}],
+        policy={"name": "strict", "passed": False, "violations": [{"reason": "too risky"}]},
+    )
+
+    output = format_human(report)
+
+    details = output.split("Details:", 1)[1]
+    assert "foo[i] = 1" in details
+    assert _ITALIC not in details
+
+
+def test_markup_in_user_text_is_rendered_literally() -> None:
+    report = _report(
+        [_finding(message="uses [bold]x[/bold] from net", snippet="eval(x)")],
+        explanations=[{"rule_id": "SG-EVAL-001", "text": "see [link]", "source": "[i]ai"}],
+        policy={"name": "strict", "passed": False, "violations": [{"reason": "[red]bad"}]},
+    )
+
+    output = format_human(report, no_color=True)
+
+    assert "uses [bold]x[/bold] from net" in output
+    assert "see [link]" in output
+    assert "([i]ai)" in output
+    assert "x [red]bad" in output
+
+
+def test_table_and_details_render_messages_alike() -> None:
+    report = _report(
+        [
+            _finding(message="plain [b]bold?[/b] message", snippet="x = 1"),
+            _finding(rule_id="SG-EVAL-002", message="eval of arr[i] from net", snippet="y"),
+        ]
+    )
+
+    output = format_human(report)
+
+    assert output.count("plain [b]bold?[/b] message") == 2
+    assert output.count(" of arr[i] from net") == 2
+    assert "\x1b[1;91meval" in output
+
+
+def test_no_color_table_and_details_render_messages_alike() -> None:
+    report = _report([_finding(message="arr[i] from net", snippet="eval(arr[i])")])
+
+    output = format_human(report, no_color=True)
+
+    assert output.count("arr[i] from net") == 2
+    assert "| 3 | eval(arr[i])" in output
+
+
+def test_backslash_before_dangerous_token_renders_literally() -> None:
+    message = "C:\\rm -rf / then C:\\ rm -rf and x\\eval(y)"
+    report = _report([_finding(message=message, snippet=message)])
+
+    output = format_human(report)
+    plain = format_human(report, no_color=True)
+
+    assert "\x1b[1;91mrm -rf" in output
+    assert plain.count(message) == 3
+
+
+def test_auto_color_system_follows_the_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Rich caches a style's ANSI codes for the first color system that renders
+    # it, so the detected system is checked on the console, not in the bytes.
+    consoles: list[Console] = []
+
+    def _console(**kwargs: Any) -> Console:
+        consoles.append(Console(**kwargs))
+        return consoles[-1]
+
+    monkeypatch.setattr(human, "Console", _console)
+    monkeypatch.delenv("COLORTERM", raising=False)
+    report = _report([_finding(snippet="x")])
+
+    for term in ("xterm", "xterm-256color"):
+        monkeypatch.setenv("TERM", term)
+        format_human(report, color_system="auto")
+    monkeypatch.setenv("COLORTERM", "truecolor")
+    format_human(report, color_system="auto")
+
+    assert [c.color_system for c in consoles] == ["standard", "256", "truecolor"]
@@ -0,0 +1,71 @@
+"""Tests for the JSON formatter."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from skillgate.cli.formatters import json_fmt
+from skillgate.cli.formatters.json_fmt import format_json
+from skillgate.core.models import RiskScore, ScanReport, Severity
+
+
+class _Opaque:
+    def __str__(self) -> str:
+        return "opaque-value"
+
+
+def _report(**extra: object) -> ScanReport:
+    return ScanReport(
+        timestamp="2025-01-01T00:00:00Z",
+        risk_score=RiskScore(total=0, severity=Severity.LOW, findings_count=0),
+        **extra,
+    )
+
+
+def test_unknown_values_fall_back_to_str() -> None:
+    report = _report(policy={"name": "custom", "handle": _Opaque()})
+
+    payload = json.loads(format_json(report))
+
+    assert payload["policy"]["handle"] == "opaque-value"
+    assert payload["policy"]["name"] == "custom"
+
+
+def test_non_ascii_is_written_as_utf8() -> None:
+    if not json_fmt._HAS_DUMP_FALLBACK:
+        pytest.skip("requires pydantic>=2.11")
+
+    output = format_json(_report(bundle_name="démo"))
+
+    assert '"bundle_name": "démo"' in output
+    assert json.loads(output)["bundle_name"] == "démo"
+
+
+def _special_values_report() -> ScanReport:
+    at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    return _report(policy={"at": at, "ratio": float("nan"), "limit": float("inf")})
+
+
+def test_datetimes_and_non_finite_floats_are_valid_json() -> None:
+    if not json_fmt._HAS_DUMP_FALLBACK:
+        pytest.skip("requires pydantic>=2.11")
+
+    output = format_json(_special_values_report())
+
+    assert '"at": "2025-01-02T03:04:05Z"' in output
+    assert '"ratio": null' in output
+    assert '"limit": null' in output
+
+
+def test_older_pydantic_keeps_json_dumps_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_fmt, "_HAS_DUMP_FALLBACK", False)
+
+    output = format_json(_special_values_report())
+
+    assert '"at": "2025-01-02 03:04:05+00:00"' in output
+    assert '"ratio": NaN' in output
+    assert '"limit": Infinity' in output
+    assert '"bundle_name": "d\\u00e9mo"' in format_json(_report(bundle_name="démo"))
@@ -0,0 +1,32 @@
+"""Tests for the core data models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from skillgate.core.models import Category, Finding, Severity
+
+
+def _finding(**overrides: Any) -> Finding:
+    fields: dict[str, Any] = {
+        "rule_id": "SG-EVAL-001",
+        "rule_name": "dynamic_eval",
+        "severity": Severity.HIGH,
+        "category": Category.EVAL,
+        "message": "Dynamic code evaluation",
+        "file": "skill.py",
+        "line": 3,
+        "weight": 40,
+    }
+    fields.update(overrides)
+    return Finding(**fields)
+
+
+def test_generated_finding_id_is_stable_across_releases() -> None:
+    # Baseline suppression files key on these IDs; they must never change.
+    assert _finding().finding_id == "SGF-0e36f199972d"
+    assert _finding(column=7).finding_id == "SGF-65c476a75fe9"
+
+
+def test_explicit_finding_id_is_kept() -> None:
+    assert _finding(finding_id="custom").finding_id == "custom"
@@ -0,0 +1,182 @@
+"""Tests for remote bundle archive extraction guards."""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from skillgate.cli import remote
+
+
+def _tar_gz(members: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, payload in members.items():
+            info = tarfile.TarInfo(name)
+            if name.endswith("/"):
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+                continue
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+    return buf.getvalue()
+
+
+def test_tar_within_member_limit_extracts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(remote, "_MAX_ARCHIVE_MEMBERS", 3)
+
+    remote._extract_tar(_tar_gz({"a.txt": b"a", "b.txt": b"b", "c.txt": b"c"}), tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_tar_over_member_limit_is_rejected(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(remote, "_MAX_ARCHIVE_MEMBERS", 3)
+    data = _tar_gz({f"{i}.txt": b"x" for i in range(4)})
+
+    with pytest.raises(ValueError, match="member limit"):
+        remote._extract_tar(data, tmp_path)
+
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, payload in members.items():
+            zf.writestr(name, payload)
+    return buf.getvalue()
+
+
+def test_zip_with_current_directory_entry_extracts(tmp_path: Path) -> None:
+    remote._extract_zip(_zip({"./": b"", "./a.txt": b"a"}), tmp_path)
+
+    assert (tmp_path / "a.txt").read_bytes() == b"a"
+
+
+@pytest.mark.parametrize("name", ["../evil.txt", "/abs/evil.txt", "a/../../evil.txt"])
+def test_zip_member_outside_target_is_rejected(tmp_path: Path, name: str) -> None:
+    target = tmp_path / "out"
+    target.mkdir()
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        remote._extract_zip(_zip({name: b"x"}), target)
+
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_zip_member_with_bomb_ratio_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="compression ratio"):
+        remote._extract_zip(_zip({"bomb.bin": bytes(8 * 1024 * 1024)}), tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _serve(archives: dict[str, bytes], seen: list[tuple[str, str]]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url)))
+        payload = archives.get(str(request.url))
+        if payload is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"" if request.method == "HEAD" else payload)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def isolated_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("SKILLGATE_EXTRACT_TMPFS", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def test_fetch_succeeding_on_first_candidate_sends_one_request(
+    isolated_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = "https://forge.example/org/repo"
+    seen: list[tuple[str, str]] = []
+    client = _serve({url: _tar_gz({"repo/SKILL.md": b"# skill"})}, seen)
+    monkeypatch.setattr(remote, "_shared_client", lambda: client)
+
+    bundle = remote.fetch_bundle(url)
+
+    assert (bundle / "SKILL.md").read_bytes() == b"# skill"
+    assert seen == [("GET", url)]
+
+
+def test_fetch_skips_candidates_whose_probe_missed(
+    isolated_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = "https://forge.example/org/repo"
+    archive_url = f"{url}/-/archive/main/repo-main.tar.gz"
+    seen: list[tuple[str, str]] = []
+    client = _serve({archive_url: _tar_gz({"repo/SKILL.md": b"# skill"})}, seen)
+    monkeypatch.setattr(remote, "_shared_client", lambda: client)
+
+    bundle = remote.fetch_bundle(url)
+
+    assert (bundle / "SKILL.md").read_bytes() == b"# skill"
+    gets = [u for method, u in seen if method == "GET"]
+    assert gets == [url, archive_url]
+
+
+def test_tar_with_repetitive_file_extracts(tmp_path: Path) -> None:
+    payload = b"a" * (3 * 1024 * 1024)
+
+    remote._extract_tar(_tar_gz({"notes.txt": payload}), tmp_path)
+
+    assert (tmp_path / "notes.txt").read_bytes() == payload
+
+
+def test_tar_bomb_is_rejected_before_it_is_written(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    floor = 1024 * 1024
+    monkeypatch.setattr(remote, "_STREAM_COMPRESSION_RATIO_FLOOR", floor)
+    data = _tar_gz({"bomb.bin": bytes(16 * 1024 * 1024)})
+
+    with pytest.raises(ValueError, match="compression ratio"):
+        remote._extract_tar(data, tmp_path)
+
+    assert (tmp_path / "bomb.bin").stat().st_size <= floor
+
+
+def test_tar_with_current_directory_entry_extracts(tmp_path: Path) -> None:
+    remote._extract_tar(_tar_gz({"./": b"", "./skill/": b"", "./skill/a.txt": b"a"}), tmp_path)
+
+    assert (tmp_path / "skill" / "a.txt").read_bytes() == b"a"
+
+
+def test_tar_special_member_is_rejected(tmp_path: Path) -> None:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        fifo = tarfile.TarInfo("pipe")
+        fifo.type = tarfile.FIFOTYPE
+        tar.addfile(fifo)
+
+    with pytest.raises(ValueError, match="Unsupported member type"):
+        remote._extract_tar(buf.getvalue(), tmp_path)
+
+
+def test_extraction_stays_on_disk_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SKILLGATE_EXTRACT_TMPFS", raising=False)
+    monkeypatch.delenv("TMPDIR", raising=False)
+
+    assert remote._extraction_root() is None
+
+
+def test_tmpfs_extraction_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SKILLGATE_EXTRACT_TMPFS", "1")
+    monkeypatch.setattr(remote.os, "access", lambda path, mode: True)
+    free = remote._MAX_ARCHIVE_TOTAL_UNCOMPRESSED
+    monkeypatch.setattr(remote.shutil, "disk_usage", lambda path: SimpleNamespace(free=free))
+
+    assert remote._extraction_root() == "/dev/shm"
+
+    monkeypatch.setattr(remote.shutil, "disk_usage", lambda path: SimpleNamespace(free=free - 1))
+    assert remote._extraction_root() is None
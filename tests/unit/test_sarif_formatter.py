@@ -0,0 +1,85 @@
+"""Tests for the SARIF 2.1.0 formatter."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from skillgate.cli.formatters import sarif
+from skillgate.core.models import (
+    ArtifactProvenance,
+    Category,
+    Finding,
+    OriginType,
+    RiskScore,
+    ScanReport,
+    Severity,
+)
+
+
+def _report() -> ScanReport:
+    finding: dict[str, object] = {
+        "rule_id": "SG-NET-001",
+        "rule_name": "outbound_request",
+        "severity": "medium",
+        "category": "network",
+        "message": "Envoie des données → réseau",
+        "file": "skill.py",
+        "line": 12,
+        "snippet": "requests.get(url)  # ✓",
+        "weight": 20,
+    }
+    return ScanReport(
+        timestamp="2025-01-01T00:00:00Z",
+        bundle_name="démo",
+        risk_score=RiskScore(total=20, severity=Severity.MEDIUM, findings_count=1),
+        findings=[finding],
+    )
+
+
+def test_output_does_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    report = _report()
+
+    fast = sarif.format_sarif(report)
+    monkeypatch.setattr(sarif, "orjson", None)
+    stdlib = sarif.format_sarif(report)
+
+    assert fast == stdlib
+    assert "réseau" in stdlib
+
+
+@pytest.mark.parametrize(
+    ("severity", "level"),
+    [
+        (Severity.CRITICAL, "error"),
+        (Severity.HIGH, "error"),
+        (Severity.MEDIUM, "warning"),
+        (Severity.LOW, "note"),
+    ],
+)
+def test_result_level_follows_finding_severity(severity: Severity, level: str) -> None:
+    finding = Finding(
+        rule_id="SG-MD-001",
+        rule_name="prose_instruction",
+        severity=severity,
+        category=Category.PROMPT,
+        message="Instruction in prose",
+        file="README.md",
+        line=4,
+        weight=10,
+        provenance=ArtifactProvenance(
+            origin_type=OriginType.MARKDOWN_PROSE, source_file="README.md", section="Setup"
+        ),
+    )
+
+    result = sarif._finding_to_result(finding.model_dump(), bundle_root="")
+    artifact_location = result["locations"][0]["physicalLocation"]["artifactLocation"]
+
+    assert result["level"] == level
+    assert artifact_location["uriBaseId"] == "%MARKDOWN_PROSE%"
+    assert json.loads(json.dumps(artifact_location["properties"])) == {
+        "originType": "markdown_prose",
+        "section": "Setup",
+    }
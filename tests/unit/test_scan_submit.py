@@ -0,0 +1,88 @@
+"""Tests for scan report submission to the hosted API."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from skillgate.cli import scan_submit
+
+_ENDPOINT = "https://api.example/api/v1/scans"
+
+
+def _large_report() -> dict[str, object]:
+    return {"findings": [{"rule_id": f"SG-{i:04d}", "message": "x" * 40} for i in range(600)]}
+
+
+@pytest.fixture
+def sent(monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+    monkeypatch.setattr(scan_submit, "resolve_scan_submit_endpoint", lambda: _ENDPOINT)
+    monkeypatch.delenv("SKILLGATE_SUBMIT_GZIP", raising=False)
+    return requests
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request], gzip_status: int = 201
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if request.headers.get("Content-Encoding") == "gzip":
+            return httpx.Response(gzip_status, json={"scan_id": "gz", "detail": "bad body"})
+        json.loads(request.content)
+        return httpx.Response(201, json={"scan_id": "plain"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(scan_submit, "_submit_client", lambda: client)
+
+
+def test_large_report_is_sent_uncompressed_by_default(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+) -> None:
+    _serve(monkeypatch, sent)
+
+    scan_id = scan_submit.submit_scan_report(report=_large_report(), bearer_token="t")
+
+    assert scan_id == "plain"
+    assert len(sent) == 1
+    assert "Content-Encoding" not in sent[0].headers
+
+
+def test_large_report_is_gzipped_when_opted_in(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+) -> None:
+    monkeypatch.setenv("SKILLGATE_SUBMIT_GZIP", "1")
+    _serve(monkeypatch, sent)
+
+    scan_id = scan_submit.submit_scan_report(report=_large_report(), bearer_token="t")
+
+    assert scan_id == "gz"
+    assert json.loads(gzip.decompress(sent[0].content)) == {"report": _large_report()}
+
+
+@pytest.mark.parametrize("status", [400, 415, 422])
+def test_rejected_gzip_body_is_resent_uncompressed(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request], status: int
+) -> None:
+    monkeypatch.setenv("SKILLGATE_SUBMIT_GZIP", "1")
+    _serve(monkeypatch, sent, gzip_status=status)
+
+    scan_id = scan_submit.submit_scan_report(report=_large_report(), bearer_token="t")
+
+    assert scan_id == "plain"
+    assert [r.headers.get("Content-Encoding") for r in sent] == ["gzip", None]
+
+
+def test_server_error_on_gzip_body_is_not_retried(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+) -> None:
+    monkeypatch.setenv("SKILLGATE_SUBMIT_GZIP", "1")
+    _serve(monkeypatch, sent, gzip_status=500)
+
+    with pytest.raises(scan_submit.SkillGateError, match=r"\(500\): bad body"):
+        scan_submit.submit_scan_report(report=_large_report(), bearer_token="t")
+
+    assert len(sent) == 1
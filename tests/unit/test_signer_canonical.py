@@ -0,0 +1,62 @@
+"""Tests for canonical JSON hashing used by report signing."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from skillgate.core.signer.canonical import (
+    build_signing_scope,
+    canonical_json,
+    hash_canonical,
+    hash_signing_scope,
+)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _report(findings: int) -> dict[str, object]:
+    return {
+        "version": "1.0.0",
+        "bundle_name": "démo \U0001f600",
+        "risk_score": {"total": 42, "severity": "medium", "breakdown": {"shell": 40, "eval": 2}},
+        "findings": [
+            {
+                "rule_id": f"SG-{i:03d}",
+                "line": i + 1,
+                "score": 1.5e-7 * i,
+                "tags": ["a", None, True, {"z": 1, "a": [1, 2, {"k": "v"}]}],
+            }
+            for i in range(findings)
+        ],
+        "extraction_manifest": {"provenance_records": [{"origin_type": "code"}], "warnings": []},
+        "nested": [[[[["deep"]]]], {}, []],
+        "attestation": {"signature": "00"},
+    }
+
+
+@pytest.mark.parametrize("findings", [0, 1, 255, 256, 257, 1000])
+def test_hash_canonical_matches_canonical_json_digest(findings: int) -> None:
+    report = _report(findings)
+
+    assert hash_canonical(report) == _sha256(canonical_json(report))
+
+
+@pytest.mark.parametrize("findings", [0, 3, 600])
+def test_hash_signing_scope_matches_built_scope(findings: int) -> None:
+    report = _report(findings)
+
+    expected = _sha256(canonical_json(build_signing_scope(report)))
+
+    assert hash_signing_scope(report) == expected
+    assert hash_signing_scope(report) == hash_canonical(build_signing_scope(report))
+
+
+def test_hash_signing_scope_ignores_attestation() -> None:
+    report = _report(2)
+    resigned = dict(report, attestation={"signature": "ff"})
+
+    assert hash_signing_scope(report) == hash_signing_scope(resigned)
@@ -0,0 +1,132 @@
+"""Tests for Merkle-batched report signing and verification."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from skillgate.core.errors import SigningError
+from skillgate.core.signer.engine import (
+    sign_report,
+    sign_reports_batched,
+    verify_report,
+    verify_report_with_key,
+    verify_reports_batch,
+)
+from skillgate.core.signer.keys import generate_keypair, load_public_key_hex
+from skillgate.core.signer.merkle import build_levels, inclusion_proof, leaf_hash, root_from_proof
+
+
+@pytest.fixture
+def key_dir(tmp_path: Path) -> Path:
+    generate_keypair(tmp_path)
+    return tmp_path
+
+
+def _reports(count: int) -> list[dict[str, Any]]:
+    return [
+        {"bundle_name": f"skill-{i}", "risk_score": {"total": i}, "findings": [{"line": i}]}
+        for i in range(count)
+    ]
+
+
+def _signed_batch(key_dir: Path, count: int) -> list[dict[str, Any]]:
+    reports = _reports(count)
+    attestations = sign_reports_batched(reports, key_dir)
+    return [
+        dict(report, attestation=att) for report, att in zip(reports, attestations, strict=True)
+    ]
+
+
+@pytest.mark.parametrize("count", range(1, 14))
+def test_every_proof_leads_to_the_root(count: int) -> None:
+    leaves = [leaf_hash(bytes([i]) * 32) for i in range(count)]
+    levels = build_levels(leaves)
+
+    for index, leaf in enumerate(leaves):
+        assert root_from_proof(leaf, inclusion_proof(levels, index)) == levels[-1][0]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_batched_reports_verify(key_dir: Path, count: int) -> None:
+    signed = _signed_batch(key_dir, count)
+    public_key_hex = load_public_key_hex(key_dir)
+
+    assert len({report["attestation"]["signature"] for report in signed}) == 1
+    for report in signed:
+        assert verify_report(report)
+        assert verify_report_with_key(report, public_key_hex)
+
+
+def test_batch_and_single_attestations_verify_together(key_dir: Path) -> None:
+    single = _reports(1)[0]
+    single["attestation"] = sign_report(single, key_dir)
+
+    outcomes = verify_reports_batch([single, *_signed_batch(key_dir, 4)])
+
+    assert outcomes == [None] * 5
+
+
+def test_tampered_report_is_rejected(key_dir: Path) -> None:
+    report = _signed_batch(key_dir, 5)[2]
+    report["risk_score"]["total"] = 0
+
+    with pytest.raises(SigningError, match="hash mismatch"):
+        verify_report(report)
+
+
+def test_report_hash_rewritten_to_match_tampering_is_rejected(key_dir: Path) -> None:
+    signed = _signed_batch(key_dir, 5)
+    forged = copy.deepcopy(signed[2])
+    forged["risk_score"]["total"] = 0
+    forged["attestation"]["report_hash"] = sign_report(forged, key_dir)["report_hash"]
+
+    with pytest.raises(SigningError, match="Merkle proof mismatch"):
+        verify_report(forged)
+
+
+def test_proof_from_another_report_is_rejected(key_dir: Path) -> None:
+    signed = _signed_batch(key_dir, 5)
+    signed[1]["attestation"]["merkle_proof"] = signed[3]["attestation"]["merkle_proof"]
+
+    with pytest.raises(SigningError, match="Merkle proof mismatch"):
+        verify_report(signed[1])
+
+
+def test_flipped_proof_position_is_rejected(key_dir: Path) -> None:
+    report = _signed_batch(key_dir, 4)[0]
+    step = report["attestation"]["merkle_proof"][0]
+    step["position"] = "left" if step["position"] == "right" else "right"
+
+    with pytest.raises(SigningError, match="Merkle proof mismatch"):
+        verify_report(report)
+
+
+def test_invalid_proof_position_is_rejected(key_dir: Path) -> None:
+    report = _signed_batch(key_dir, 4)[0]
+    report["attestation"]["merkle_proof"][0]["position"] = "up"
+
+    with pytest.raises(SigningError, match="invalid position"):
+        verify_report(report)
+
+
+def test_root_signature_from_another_key_is_rejected(key_dir: Path, tmp_path: Path) -> None:
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    generate_keypair(other_dir)
+    report = _signed_batch(key_dir, 3)[1]
+
+    with pytest.raises(SigningError, match="key mismatch"):
+        verify_report_with_key(report, load_public_key_hex(other_dir))
+
+
+def test_bad_root_signature_is_rejected(key_dir: Path) -> None:
+    report = _signed_batch(key_dir, 3)[1]
+    signature = report["attestation"]["signature"]
+    report["attestation"]["signature"] = ("0" if signature[0] != "0" else "1") + signature[1:]
+
+    with pytest.raises(SigningError, match="tampered"):
+        verify_report(report)